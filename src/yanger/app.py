@@ -49,6 +49,16 @@ logger = logging.getLogger(__name__)
 # videos (running user shell against a big selection deserves a look-before-you-leap).
 RUN_CONFIRM_THRESHOLD = 5
 
+# Keys that answer the 'o' sort prompt (see handle_sort_key).
+SORT_KEYS = frozenset({'t', 'd', 'p', 'v', 'D', 'escape'})
+
+# Keys on_key hands to MillerView.handle_key: navigation, ranger commands, search and
+# visual mode. 'u', 'g' and 'c' are prefixes resolved at app level and never reach it.
+MILLER_VIEW_KEYS = frozenset({
+    'h', 'j', 'k', 'l', 'up', 'down', 'left', 'right', 'G', 'enter', 'space',
+    'd', 'y', 'p', 'n', 'N', 'v', 'V', 'escape', 'o', 'pageup', 'pagedown',
+})
+
 
 class YouTubeRangerApp(App):
     """Main application class for YouTube Ranger."""
@@ -254,6 +264,10 @@ class YouTubeRangerApp(App):
             logger.error(f"Error during initialization: {e}")
             self.notify(f"Initialization error: {e}", severity="error")
             self.exit(1)
+
+    def on_unmount(self) -> None:
+        """Checkpoint the WAL and close the cache connection on shutdown."""
+        self._cache.close()
     
     def _append_virtual_playlists(self) -> None:
         """Load and append virtual playlists from database."""
@@ -1162,7 +1176,7 @@ class YouTubeRangerApp(App):
         
         # FIRST: Check for pending sort selection
         if hasattr(self, '_pending_sort') and self._pending_sort:
-            if event.key in ['t', 'd', 'p', 'v', 'D', 'escape']:
+            if event.key in SORT_KEYS:
                 await self.handle_sort_key(event.key)
             self._pending_sort = False
             event.stop()
@@ -1264,7 +1278,7 @@ class YouTubeRangerApp(App):
         # pageup/pagedown for pagination
         # Note: 'u' is now handled at app level for undo, not passed to miller_view
         # Note: 'g' and 'c' are now intercepted for special commands
-        elif self.miller_view and event.key in ['h', 'j', 'k', 'l', 'up', 'down', 'left', 'right', 'G', 'enter', 'space', 'd', 'y', 'p', 'n', 'N', 'v', 'V', 'escape', 'o', 'pageup', 'pagedown']:
+        elif self.miller_view and event.key in MILLER_VIEW_KEYS:
             await self.miller_view.handle_key(event.key)
             event.stop()
 
@@ -4,12 +4,17 @@ Provides persistent caching of playlist and video data using SQLite.
 """
 # Modified: 2025-08-08
 
+import gzip
+import io
 import os
+import shutil
 import sqlite3
 import json
+import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 import logging
@@ -90,24 +95,165 @@ _MIGRATIONS = (
 )
 
 
+# Base schema, run by _init_database on every open. Everything is IF NOT EXISTS, so new
+# tables and indexes added here reach existing databases too; changes to existing tables
+# (new columns) must go in _MIGRATIONS above instead.
+_SCHEMA_SQL = """
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS cache_metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS playlists (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT,
+    item_count INTEGER,
+    privacy_status TEXT,
+    channel_id TEXT,
+    channel_title TEXT,
+    etag TEXT,
+    cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    accessed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    hit_count INTEGER DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS videos (
+    id TEXT,
+    playlist_id TEXT,
+    playlist_item_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    channel_title TEXT,
+    description TEXT,
+    position INTEGER,
+    duration TEXT,
+    view_count INTEGER,
+    added_at TIMESTAMP,
+    published_at TIMESTAMP,
+    cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (playlist_id) REFERENCES playlists(id) ON DELETE CASCADE
+);
+
+-- Indices for performance
+CREATE INDEX IF NOT EXISTS idx_videos_playlist ON videos(playlist_id);
+CREATE INDEX IF NOT EXISTS idx_playlists_cached ON playlists(cached_at);
+
+-- Virtual playlists tables
+CREATE TABLE IF NOT EXISTS virtual_playlists (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT,
+    source TEXT,  -- 'takeout', 'manual'
+    imported_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    video_count INTEGER DEFAULT 0,
+    is_active BOOLEAN DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS virtual_videos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    playlist_id TEXT NOT NULL,
+    video_id TEXT NOT NULL,
+    title TEXT,
+    channel_title TEXT,
+    added_at TIMESTAMP,
+    position INTEGER,
+    FOREIGN KEY (playlist_id) REFERENCES virtual_playlists(id) ON DELETE CASCADE,
+    UNIQUE(playlist_id, video_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_virtual_videos_playlist ON virtual_videos(playlist_id);
+CREATE INDEX IF NOT EXISTS idx_virtual_videos_video ON virtual_videos(video_id);
+
+-- Video transcripts table
+CREATE TABLE IF NOT EXISTS video_transcripts (
+    video_id TEXT PRIMARY KEY,
+    transcript_text BLOB,  -- Compressed transcript (gzip)
+    transcript_json TEXT,  -- JSON with timestamps and metadata
+    language TEXT,
+    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    auto_generated BOOLEAN,
+    fetch_status TEXT  -- 'SUCCESS', 'NOT_AVAILABLE', 'ERROR'
+);
+
+CREATE INDEX IF NOT EXISTS idx_transcripts_video ON video_transcripts(video_id);
+-- Covering index for get_transcript_status: the status comes straight from the
+-- index leaf, without touching the row (and its transcript BLOB).
+CREATE INDEX IF NOT EXISTS idx_transcripts_status_cover ON video_transcripts(video_id, fetch_status);
+
+COMMIT;
+"""
+
+
+# Transcript statements shared by the single-row and bulk paths. Keeping each as one
+# module-level string means sqlite3's per-connection statement cache (keyed on the SQL
+# text) compiles it once for the life of the cache's shared connection.
+_TRANSCRIPT_UPSERT_SQL = """
+    INSERT OR REPLACE INTO video_transcripts
+    (video_id, transcript_text, transcript_json, language,
+     fetched_at, auto_generated, fetch_status)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_TRANSCRIPT_COLUMNS = (
+    "video_id", "transcript_text", "transcript_json", "language",
+    "fetched_at", "auto_generated", "fetch_status",
+)
+_TRANSCRIPT_SELECT_SQL = f"""
+    SELECT {", ".join(_TRANSCRIPT_COLUMNS)}
+    FROM video_transcripts WHERE video_id = ?
+"""
+# Without INDEXED BY the planner prefers the primary key's unique autoindex, which then
+# reads the row itself -- walking the transcript BLOB's overflow pages to reach
+# fetch_status. The covering index answers from its leaf alone.
+_TRANSCRIPT_STATUS_SQL = """
+    SELECT fetch_status FROM video_transcripts INDEXED BY idx_transcripts_status_cover
+    WHERE video_id = ?
+"""
+
+
 class PersistentCache:
     """SQLite-based persistent cache for playlists and videos."""
 
     # Latest schema version = number of migrations. Stored per-db in PRAGMA user_version.
     SCHEMA_VERSION = len(_MIGRATIONS)
 
+    # WAL lets a reader and a writer coexist; busy_timeout makes a blocked
+    # connection wait+retry instead of raising immediately. Both matter now that
+    # MCP off-loads writes to a thread while the TUI reads — otherwise concurrent
+    # access surfaces "database is locked". journal_mode persists in the db file;
+    # busy_timeout is per-connection so it is set on every connect.
+    DEFAULT_PRAGMAS: Dict[str, Any] = {"busy_timeout": 5000, "journal_mode": "WAL"}
+
     def __init__(self, cache_dir: Optional[Path] = None, 
                  ttl_days: int = 7,
-                 auto_cleanup: bool = True):
+                 auto_cleanup: bool = True,
+                 pragmas: Optional[Dict[str, Any]] = None):
         """Initialize persistent cache.
         
         Args:
             cache_dir: Directory for cache database (default: ~/.cache/yanger)
             ttl_days: Time-to-live in days (default: 7)
             auto_cleanup: Automatically clean expired entries (default: True)
+            pragmas: Extra PRAGMA settings applied on every connection, overriding
+                the defaults (e.g. {"synchronous": "OFF"} for throwaway test databases)
         """
         self.ttl_days = ttl_days
         self.auto_cleanup = auto_cleanup
+
+        # PRAGMA takes no bound parameters, so names and values are interpolated;
+        # only accept bare identifiers and numbers.
+        pragmas = dict(pragmas or {})
+        for name, value in pragmas.items():
+            if not name.isidentifier() or not str(value).lstrip("-").isalnum():
+                raise ValueError(f"Invalid PRAGMA setting: {name}={value!r}")
+        self.pragmas = {**self.DEFAULT_PRAGMAS, **pragmas}
+
+        # One connection per cache, opened on first use and shared by every method. The
+        # lock serialises it across threads (MCP runs cache calls via asyncio.to_thread).
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
         
         # Setup cache directory
         if cache_dir is None:
@@ -127,124 +273,65 @@ class PersistentCache:
             
         logger.info(f"Initialized persistent cache at {self.db_path}")
     
-    def _connect(self) -> sqlite3.Connection:
+    def _open_connection(self) -> sqlite3.Connection:
         """Open a SQLite connection with foreign keys enforced.
 
-        SQLite enforces foreign keys per-connection (default OFF), so every
-        connection in this module must opt in or ON DELETE CASCADE silently
-        no-ops (leaking orphaned videos / virtual_videos rows).
+        SQLite enforces foreign keys per-connection (default OFF), so the
+        connection must opt in or ON DELETE CASCADE silently no-ops (leaking
+        orphaned videos / virtual_videos rows).
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.execute("PRAGMA foreign_keys = ON")
-        # WAL lets a reader and a writer coexist; busy_timeout makes a blocked
-        # connection wait+retry instead of raising immediately. Both matter now that
-        # MCP off-loads writes to a thread while the TUI reads — otherwise concurrent
-        # access surfaces "database is locked". journal_mode persists in the db file;
-        # busy_timeout is per-connection so it is set on every connect.
-        conn.execute("PRAGMA busy_timeout = 5000")
-        conn.execute("PRAGMA journal_mode = WAL")
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
         return conn
 
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Borrow the cache's shared connection for one unit of work.
+
+        Holds the lock for the duration of the block, commits on success and rolls
+        back on error (like ``with sqlite3.connect(...)``). Blocks may set
+        ``row_factory``; it is reset afterwards so the next borrower gets tuples.
+        """
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._open_connection()
+            conn = self._conn
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.row_factory = None
+
     def db_connection(self):
         """Get a database connection context manager."""
         return self._connect()
 
+    def close(self) -> None:
+        """Checkpoint and close the shared connection; the next call reopens it.
+
+        In WAL mode the log is folded back into the database and truncated first, so
+        one flush happens here rather than wherever autocheckpointing would have hit
+        (callers wanting exactly that can pass pragmas={"wal_autocheckpoint": 0}).
+        """
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                mode = self._conn.execute("PRAGMA journal_mode").fetchone()[0]
+                if mode.lower() == "wal":
+                    self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            finally:
+                self._conn.close()
+                self._conn = None
+
     def _init_database(self) -> None:
         """Initialize SQLite database with schema."""
         with self._connect() as conn:
-            # Create tables
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS cache_metadata (
-                    key TEXT PRIMARY KEY,
-                    value TEXT,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS playlists (
-                    id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    item_count INTEGER,
-                    privacy_status TEXT,
-                    channel_id TEXT,
-                    channel_title TEXT,
-                    etag TEXT,
-                    cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    accessed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    hit_count INTEGER DEFAULT 0
-                )
-            """)
-            
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS videos (
-                    id TEXT,
-                    playlist_id TEXT,
-                    playlist_item_id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    channel_title TEXT,
-                    description TEXT,
-                    position INTEGER,
-                    duration TEXT,
-                    view_count INTEGER,
-                    added_at TIMESTAMP,
-                    published_at TIMESTAMP,
-                    cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (playlist_id) REFERENCES playlists(id) ON DELETE CASCADE
-                )
-            """)
-            
-            # Create indices for performance
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_videos_playlist ON videos(playlist_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_playlists_cached ON playlists(cached_at)")
-            
-            # Virtual playlists tables
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS virtual_playlists (
-                    id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    source TEXT,  -- 'takeout', 'manual'
-                    imported_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    video_count INTEGER DEFAULT 0,
-                    is_active BOOLEAN DEFAULT 1
-                )
-            """)
-            
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS virtual_videos (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    playlist_id TEXT NOT NULL,
-                    video_id TEXT NOT NULL,
-                    title TEXT,
-                    channel_title TEXT,
-                    added_at TIMESTAMP,
-                    position INTEGER,
-                    FOREIGN KEY (playlist_id) REFERENCES virtual_playlists(id) ON DELETE CASCADE,
-                    UNIQUE(playlist_id, video_id)
-                )
-            """)
-            
-            # Create indices for virtual tables
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_virtual_videos_playlist ON virtual_videos(playlist_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_virtual_videos_video ON virtual_videos(video_id)")
-
-            # Video transcripts table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS video_transcripts (
-                    video_id TEXT PRIMARY KEY,
-                    transcript_text BLOB,  -- Compressed transcript (gzip)
-                    transcript_json TEXT,  -- JSON with timestamps and metadata
-                    language TEXT,
-                    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    auto_generated BOOLEAN,
-                    fetch_status TEXT  -- 'SUCCESS', 'NOT_AVAILABLE', 'ERROR'
-                )
-            """)
-
-            # Create index for transcript lookups
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_transcripts_video ON video_transcripts(video_id)")
+            # The whole base schema in one script and one transaction (one commit on a
+            # fresh db); IF NOT EXISTS makes it a read-only no-op on an existing one.
+            conn.executescript(_SCHEMA_SQL)
 
             # Apply versioned migrations (PRAGMA user_version), replacing the former no-op
             # schema_version bump.
@@ -1066,24 +1153,16 @@ class PersistentCache:
             Dictionary with transcript data or None if not cached
         """
         with self._connect() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT * FROM video_transcripts WHERE video_id = ?
-            """, (video_id,))
+            row = conn.execute(_TRANSCRIPT_SELECT_SQL, (video_id,)).fetchone()
 
-            row = cursor.fetchone()
-            if row is None:
-                return None
+        if row is None:
+            return None
 
-            return {
-                'video_id': row['video_id'],
-                'transcript_text': row['transcript_text'],
-                'transcript_json': row['transcript_json'],
-                'language': row['language'],
-                'fetched_at': row['fetched_at'],
-                'auto_generated': bool(row['auto_generated']),
-                'fetch_status': row['fetch_status']
-            }
+        # Plain tuple zipped onto the column names; auto_generated is the only column
+        # that needs converting (SQLite stores the bool as 0/1).
+        transcript = dict(zip(_TRANSCRIPT_COLUMNS, row, strict=True))
+        transcript['auto_generated'] = bool(transcript['auto_generated'])
+        return transcript
 
     def cache_transcript(self, video_id: str, transcript_text: Optional[bytes],
                         transcript_json: Optional[str], language: Optional[str],
@@ -1099,12 +1178,7 @@ class PersistentCache:
             fetch_status: 'SUCCESS', 'NOT_AVAILABLE', or 'ERROR'
         """
         with self._connect() as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO video_transcripts
-                (video_id, transcript_text, transcript_json, language,
-                 fetched_at, auto_generated, fetch_status)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
+            conn.execute(_TRANSCRIPT_UPSERT_SQL, (
                 video_id,
                 transcript_text,
                 transcript_json,
@@ -1117,6 +1191,28 @@ class PersistentCache:
 
         logger.debug(f"Cached transcript for video {video_id} (status: {fetch_status})")
 
+    def cache_transcripts_bulk(self, rows: List[Tuple[str, Optional[bytes], Optional[str],
+                                                      Optional[str], bool, str]]) -> int:
+        """Cache many transcripts in a single transaction.
+
+        Args:
+            rows: Tuples of (video_id, transcript_text, transcript_json, language,
+                auto_generated, fetch_status), in cache_transcript's argument order
+
+        Returns:
+            Number of rows written
+        """
+        fetched_at = datetime.now().isoformat()
+        with self._connect() as conn:
+            conn.executemany(_TRANSCRIPT_UPSERT_SQL, [
+                (video_id, text, json_str, language, fetched_at, auto_generated, status)
+                for video_id, text, json_str, language, auto_generated, status in rows
+            ])
+            conn.commit()
+
+        logger.debug(f"Cached {len(rows)} transcripts")
+        return len(rows)
+
     def export_transcript(self, video_id: str, directory: Path) -> Tuple[bool, Optional[str]]:
         """Export transcript to text and JSON files.
 
@@ -1138,18 +1234,27 @@ class PersistentCache:
 
             # Export plain text
             if transcript_data['transcript_text']:
-                from .core.transcript_fetcher import TranscriptFetcher
-                text = TranscriptFetcher.decompress_transcript(transcript_data['transcript_text'])
+                # The blob is gzip'd UTF-8 -- already the file's bytes -- so inflate it
+                # straight into the file instead of decoding to a str and re-encoding.
+                # Inflate into a temp file beside it and rename on success, so a corrupt
+                # blob leaves no truncated export behind.
                 txt_path = directory / f"{video_id}.txt"
-                with open(txt_path, 'w', encoding='utf-8') as f:
-                    f.write(text)
+                tmp_path = directory / f".{video_id}.txt.tmp"
+                blob = io.BytesIO(transcript_data['transcript_text'])
+                try:
+                    with gzip.GzipFile(fileobj=blob) as src, open(tmp_path, 'wb') as dst:
+                        shutil.copyfileobj(src, dst)
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+                os.replace(tmp_path, txt_path)
                 logger.info(f"Exported transcript text to {txt_path}")
 
             # Export JSON
             if transcript_data['transcript_json']:
                 json_path = directory / f"{video_id}.json"
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    f.write(transcript_data['transcript_json'])
+                with open(json_path, 'wb') as f:
+                    f.write(transcript_data['transcript_json'].encode('utf-8'))
                 logger.info(f"Exported transcript JSON to {json_path}")
 
             return True, None
@@ -1168,9 +1273,7 @@ class PersistentCache:
             Status string ('SUCCESS', 'NOT_AVAILABLE', 'ERROR') or None if not cached
         """
         with self._connect() as conn:
-            cursor = conn.execute("""
-                SELECT fetch_status FROM video_transcripts WHERE video_id = ?
-            """, (video_id,))
+            cursor = conn.execute(_TRANSCRIPT_STATUS_SQL, (video_id,))
 
             row = cursor.fetchone()
             return row[0] if row else None
@@ -1182,10 +1285,7 @@ class PersistentCache:
             Number of transcripts cleared
         """
         with self._connect() as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM video_transcripts")
-            count = cursor.fetchone()[0]
-
-            conn.execute("DELETE FROM video_transcripts")
+            count = conn.execute("DELETE FROM video_transcripts").rowcount
             conn.commit()
 
         logger.info(f"Cleared {count} cached transcripts")
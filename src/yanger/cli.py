@@ -41,6 +41,17 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
+def _open_cache() -> PersistentCache:
+    """Open the persistent cache for the running command.
+
+    It is closed (WAL checkpointed, connection released) when the command's click
+    context is torn down, which also happens on sys.exit and on errors.
+    """
+    cache = PersistentCache()
+    click.get_current_context().call_on_close(cache.close)
+    return cache
+
+
 @click.group(invoke_without_command=True)
 @click.option('--version', is_flag=True, help='Show version and exit')
 @click.option('-v', '--verbose', is_flag=True, help='Enable verbose logging')
@@ -221,7 +232,7 @@ def quota():
         auth_handler.authenticate()
         
         # Create API client (share the cross-process quota counter via the cache)
-        client = YouTubeAPIClient(auth_handler, quota_store=PersistentCache())
+        client = YouTubeAPIClient(auth_handler, quota_store=_open_cache())
 
         # Get channel info to test and use 1 quota unit
         client._track_quota('playlists.list')
@@ -298,7 +309,7 @@ def takeout(ctx, paths, merge, verbose):
     
     # Initialize parser and cache
     parser = TakeoutParser()
-    cache = PersistentCache()
+    cache = _open_cache()
     
     # Process all takeout paths
     all_playlists = parser.process_multiple(list(paths))
@@ -664,7 +675,7 @@ def export(format, output, include_virtual, include_real, verbose):
             output_path = Path(f'yanger_export_{timestamp}.{format}')
     
     # Initialize components
-    cache = PersistentCache()
+    cache = _open_cache()
     api_client = None
     
     # Setup API client if exporting real playlists
@@ -672,7 +683,7 @@ def export(format, output, include_virtual, include_real, verbose):
         try:
             auth = YouTubeAuth()
             auth.authenticate()
-            api_client = YouTubeAPIClient(auth, quota_store=PersistentCache())
+            api_client = YouTubeAPIClient(auth, quota_store=_open_cache())
         except Exception as e:
             console.print(f"[yellow]Warning: Could not authenticate YouTube API: {e}[/yellow]")
             console.print("[yellow]Skipping real playlists...[/yellow]\n")
@@ -730,8 +741,7 @@ def dedupe_virtual(dry_run, verbose):
     console.print("\n[bold cyan]Virtual Playlist Deduplicator[/bold cyan]")
     
     try:
-        from .cache import PersistentCache
-        cache = PersistentCache()
+        cache = _open_cache()
         
         # Check for duplicates
         with cache.db_connection() as conn:
@@ -830,8 +840,7 @@ def fetch_metadata(playlist, batch_size, limit, since, days_ago, dry_run, verbos
     
     try:
         # Initialize cache
-        from .cache import PersistentCache
-        cache = PersistentCache()
+        cache = _open_cache()
         
         # Get virtual playlists
         virtual_playlists = cache.get_virtual_playlists()
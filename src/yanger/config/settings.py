@@ -7,12 +7,20 @@ Handles loading and merging configuration from multiple sources.
 import logging
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from contextlib import ExitStack
+from typing import IO, Dict, Any, Optional
 import yaml
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader (bundled in PyYAML's wheels) when available; same safe schema
+# as yaml.safe_load, which always uses the pure-Python loader.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Repo-level config/default_config.yaml (src/yanger/config/settings.py -> parents[3])
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[3] / "config" / "default_config.yaml"
+
 
 @dataclass
 class UISettings:
@@ -207,6 +215,61 @@ class Settings:
             self.commands.update(other.commands)
 
 
+def _read_config(stream: IO[str]) -> Optional[Settings]:
+    """Parse one YAML config stream into Settings (None when the document is empty).
+
+    Args:
+        stream: Open config file, or any text stream holding its YAML
+
+    Returns:
+        Settings built from the document, or None
+    """
+    data = yaml.load(stream, Loader=_SafeLoader)
+    return Settings.from_dict(data) if data else None
+
+
+def _load_settings_from_streams(default_stream: Optional[IO[str]],
+                                user_stream: Optional[IO[str]]) -> Settings:
+    """Build Settings from the default config with the user config merged over it.
+
+    Args:
+        default_stream: The default config's YAML, or None to start from built-ins
+        user_stream: The user config's YAML, or None when there is none
+
+    Returns:
+        Merged Settings object (a config that fails to parse is logged and skipped)
+    """
+    settings = Settings()
+
+    if default_stream is not None:
+        try:
+            settings = _read_config(default_stream) or settings
+        except Exception as e:
+            # Route to stderr via logging: stdout is the MCP JSON-RPC channel.
+            logger.warning(f"Failed to load default config: {e}")
+
+    if user_stream is not None:
+        try:
+            user_settings = _read_config(user_stream)
+            if user_settings:
+                settings.merge(user_settings)
+        except Exception as e:
+            logger.warning(f"Failed to load user config: {e}")
+
+    return settings
+
+
+def _open_config(stack: ExitStack, path: Path, label: str) -> Optional[IO[str]]:
+    """Open a config file on stack, or return None if it is missing or unreadable."""
+    if not path.exists():
+        return None
+    try:
+        return stack.enter_context(open(path))
+    except OSError as e:
+        logger.warning(f"Failed to load {label}: {e}")
+        return None
+
+
 def load_settings(config_dir: Optional[Path] = None) -> Settings:
     """Load settings from configuration files.
     
@@ -229,35 +292,16 @@ def load_settings(config_dir: Optional[Path] = None) -> Settings:
     load_dotenv(Path.home() / ".config" / "yanger" / ".env")
     load_dotenv()
 
-    settings = Settings()
-
     # Determine config directory
     if config_dir is None:
         config_dir = Path.home() / ".config" / "yanger"
 
-    # Load system default config
-    default_config_path = Path(__file__).parent.parent.parent.parent / "config" / "default_config.yaml"
-    if default_config_path.exists():
-        try:
-            with open(default_config_path) as f:
-                data = yaml.safe_load(f)
-                if data:
-                    settings = Settings.from_dict(data)
-        except Exception as e:
-            # Route to stderr via logging: stdout is the MCP JSON-RPC channel.
-            logger.warning(f"Failed to load default config: {e}")
-
-    # Load user config
-    user_config_path = config_dir / "config.yaml"
-    if user_config_path.exists():
-        try:
-            with open(user_config_path) as f:
-                data = yaml.safe_load(f)
-                if data:
-                    user_settings = Settings.from_dict(data)
-                    settings.merge(user_settings)
-        except Exception as e:
-            logger.warning(f"Failed to load user config: {e}")
+    # System default config, then the user config merged over it
+    with ExitStack() as stack:
+        settings = _load_settings_from_streams(
+            _open_config(stack, DEFAULT_CONFIG_PATH, "default config"),
+            _open_config(stack, config_dir / "config.yaml", "user config"),
+        )
 
     # Override with environment variables
     if api_key := os.environ.get('YOUTUBE_API_KEY'):
@@ -329,7 +373,7 @@ def save_user_setting(key: str, value: Any, config_dir: Optional[Path] = None) -
     if config_path.exists():
         try:
             with open(config_path) as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_SafeLoader) or {}
         except Exception as e:
             logger.warning(f"Could not read user config for update: {e}")
             data = {}
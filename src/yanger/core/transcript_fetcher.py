@@ -6,13 +6,20 @@ Supports proxy configuration to work around YouTube IP blocking.
 # Created: 2025-11-07
 # Modified: 2025-12-30 - Added proxy support
 
-import gzip
+import codecs
 import json
 import logging
-from typing import Optional, List, Dict, Any, Tuple, TYPE_CHECKING
-from dataclasses import dataclass, asdict
+import zlib
+from typing import Optional, List, Dict, Any, Tuple, Union, TYPE_CHECKING
+from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
 
+try:  # Optional speedup (the `fast` extra); stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from .proxy import ProxySettings
 
@@ -26,26 +33,50 @@ logger = logging.getLogger(__name__)
 # app.py, mcp_server.py — shares one definition instead of hand-copying it.
 TERMINAL_TRANSCRIPT_STATUSES = frozenset({"NOT_AVAILABLE"})
 
+# zlib window bits that accept either a gzip or a zlib header (auto-detected).
+_AUTO_HEADER_WBITS = zlib.MAX_WBITS | 32
+# zlib window bits that write a gzip header and trailer.
+_GZIP_WBITS = zlib.MAX_WBITS | 16
+# Deflate level for stored transcripts: the gzip CLI's default. Level 9 (gzip.compress's
+# default) spends far more CPU searching matches for a negligible size gain on text.
+COMPRESSION_LEVEL = 6
+# One segment of the stdlib format_as_json document, laid out as json.dumps(indent=2) does.
+_JSON_SEGMENT = '    {{\n      "start": {},\n      "duration": {},\n      "text": {}\n    }}'
+# Encodes the document's scalars, keeping non-ASCII text unescaped as orjson does.
+_encode_scalar = json.JSONEncoder(ensure_ascii=False).encode
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TranscriptSegment:
-    """A single segment of transcript with timing."""
+    """A single segment of transcript with timing.
+
+    Slotted because a transcript holds thousands of these: no per-instance __dict__.
+    """
     start: float
     duration: float
     text: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class TranscriptData:
     """Complete transcript data with metadata."""
     video_id: str
     language: str
     auto_generated: bool
-    segments: List[TranscriptSegment]
+    segments: Tuple[TranscriptSegment, ...]
     fetched_at: str  # ISO 8601 timestamp
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
+        """Convert to dictionary for JSON serialization.
+
+        Built once per transcript and shared by later calls (format_as_json and the
+        MCP json response both serialize the same fetch); segments are a tuple so the
+        cache cannot go stale, but callers must treat the result as read-only.
+        """
+        return self._dict
+
+    @cached_property
+    def _dict(self) -> Dict[str, Any]:
         return {
             'video_id': self.video_id,
             'language': self.language,
@@ -58,6 +89,31 @@ class TranscriptData:
         }
 
 
+def _dumps_transcript(transcript: TranscriptData) -> str:
+    """Write transcript JSON exactly as json.dumps(to_dict(), indent=2, ensure_ascii=False).
+
+    The schema is fixed, so the layout is templated and only the scalar values go through
+    the encoder. An indent makes json.dumps fall back to its pure-Python encoder, which
+    would otherwise walk every segment dict. Timings are finite floats, whose repr is their
+    JSON form.
+    """
+    dumps = _encode_scalar
+    segments = ',\n'.join(
+        _JSON_SEGMENT.format(repr(seg.start), repr(seg.duration), dumps(seg.text))
+        for seg in transcript.segments
+    )
+    segments = '[\n' + segments + '\n  ]' if segments else '[]'
+    return (
+        '{\n'
+        f'  "video_id": {dumps(transcript.video_id)},\n'
+        f'  "language": {dumps(transcript.language)},\n'
+        f'  "auto_generated": {dumps(transcript.auto_generated)},\n'
+        f'  "fetched_at": {dumps(transcript.fetched_at)},\n'
+        f'  "segments": {segments}\n'
+        '}'
+    )
+
+
 class TranscriptFetcher:
     """Fetches and processes YouTube video transcripts."""
 
@@ -164,14 +220,14 @@ class TranscriptFetcher:
             transcript_data = transcript.fetch()
 
             # 1.x snippets expose .start/.duration/.text as attributes, not dict keys
-            segments = [
+            segments = tuple(
                 TranscriptSegment(
                     start=snippet.start,
                     duration=snippet.duration,
                     text=snippet.text
                 )
                 for snippet in transcript_data
-            ]
+            )
 
             result = TranscriptData(
                 video_id=video_id,
@@ -226,19 +282,37 @@ class TranscriptFetcher:
         Returns:
             Compressed bytes
         """
-        return gzip.compress(text.encode('utf-8'))
+        # A standard single-member gzip stream, built by zlib directly rather than
+        # through gzip's per-call header/trailer assembly.
+        compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, _GZIP_WBITS)
+        return compressor.compress(text.encode('utf-8')) + compressor.flush()
 
     @staticmethod
-    def decompress_transcript(data: bytes) -> str:
+    def decompress_transcript(data: bytes, max_chars: Optional[int] = None) -> str:
         """Decompress transcript text.
 
         Args:
             data: Compressed transcript data
+            max_chars: If set, stop inflating once more than this many characters
+                are available instead of decompressing the whole transcript. The
+                result is then a prefix that is longer than max_chars exactly when
+                the full transcript is, so callers can still add an ellipsis.
 
         Returns:
-            Plain text transcript
+            Plain text transcript (or its leading prefix when max_chars is set);
+            "" for an empty blob, as gzip.decompress(b"") gave
         """
-        return gzip.decompress(data).decode('utf-8')
+        if not data:
+            return ""
+        if max_chars is None:
+            return zlib.decompress(data, _AUTO_HEADER_WBITS).decode('utf-8')
+
+        # UTF-8 needs at most 4 bytes per character, so this many output bytes
+        # always covers max_chars + 1 complete characters when the text has them.
+        decompressor = zlib.decompressobj(_AUTO_HEADER_WBITS)
+        raw = decompressor.decompress(data, (max_chars + 1) * 4)
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        return decoder.decode(raw, final=decompressor.eof)
 
     @staticmethod
     def format_as_text(transcript: TranscriptData) -> str:
@@ -260,9 +334,28 @@ class TranscriptFetcher:
             transcript: TranscriptData object
 
         Returns:
-            JSON string
+            JSON string, indented by two spaces with non-ASCII text left unescaped. Both
+            backends (orjson when installed, the stdlib otherwise) write the same bytes for
+            transcript timings, so exports do not depend on the ``fast`` extra.
         """
-        return json.dumps(transcript.to_dict(), indent=2)
+        if orjson is not None:
+            return orjson.dumps(transcript.to_dict(), option=orjson.OPT_INDENT_2).decode('utf-8')
+        return _dumps_transcript(transcript)
+
+    @staticmethod
+    def parse_json(json_data: Union[str, bytes]) -> Dict[str, Any]:
+        """Parse transcript JSON produced by format_as_json.
+
+        Args:
+            json_data: JSON as str or UTF-8 bytes (orjson reads bytes without a decode)
+
+        Returns:
+            The transcript dictionary
+        """
+        data: Dict[str, Any] = (
+            orjson.loads(json_data) if orjson is not None else json.loads(json_data)
+        )
+        return data
 
     @staticmethod
     def format_for_display(transcript: TranscriptData, max_chars: int = 1000) -> str:
@@ -275,7 +368,16 @@ class TranscriptFetcher:
         Returns:
             Formatted text for display
         """
-        text = TranscriptFetcher.format_as_text(transcript)
+        # Join only the leading segments that reach past max_chars; the rest would be
+        # sliced off anyway, so long transcripts are not joined in full for a preview.
+        pieces = []
+        length = -1  # the first segment is not preceded by a newline
+        for seg in transcript.segments:
+            pieces.append(seg.text)
+            length += len(seg.text) + 1
+            if length > max_chars:
+                break
+        text = '\n'.join(pieces)
 
         if len(text) > max_chars:
             text = text[:max_chars] + "..."
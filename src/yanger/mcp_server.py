@@ -1032,7 +1032,7 @@ class YangerMCPServer:
             if format_type == "json":
                 return {
                     "video_id": video_id,
-                    "transcript": json.loads(cached.get("transcript_json", "{}")),
+                    "transcript": TranscriptFetcher.parse_json(cached.get("transcript_json", "{}")),
                     "language": cached.get("language"),
                     "cached": True,
                 }
@@ -1412,8 +1412,7 @@ class YangerMCPServer:
 
     def _get_all_cached_transcript_ids(self) -> List[str]:
         """Get all video IDs that have cached transcripts."""
-        import sqlite3
-        with sqlite3.connect(self.cache.db_path) as conn:
+        with self.cache.db_connection() as conn:
             cursor = conn.execute(
                 "SELECT video_id FROM video_transcripts WHERE fetch_status = 'SUCCESS'"
             )
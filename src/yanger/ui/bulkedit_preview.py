@@ -17,6 +17,8 @@ from ..bulkedit import BulkEditChanges
 class BulkEditConfirmed(Message):
     """Message sent when user confirms bulk edit."""
 
+    __slots__ = ("changes",)
+
     def __init__(self, changes: BulkEditChanges):
         super().__init__()
         self.changes = changes
@@ -24,7 +26,7 @@ class BulkEditConfirmed(Message):
 
 class BulkEditCancelled(Message):
     """Message sent when user cancels bulk edit."""
-    pass
+    __slots__ = ()
 
 
 class BulkEditPreview(ModalScreen):
@@ -13,6 +13,8 @@ from textual.message import Message
 
 class ConfirmationResult(Message):
     """Message sent when confirmation dialog is closed."""
+
+    __slots__ = ("confirmed", "action")
     
     def __init__(self, confirmed: bool, action: str = "") -> None:
         """Initialize confirmation result.
@@ -4,20 +4,65 @@ Three-column layout inspired by macOS Finder's column view.
 """
 # Created: 2025-08-03
 
-from typing import List, Optional
+from bisect import bisect_left, bisect_right
+from itertools import compress
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import asyncio
 import re
 
+from rich.errors import MarkupError
+from rich.style import Style
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Horizontal, ScrollableContainer, Container
+from textual.geometry import Region, Size
+from textual.strip import Strip
 from textual.widgets import Static, ListView, ListItem, Label, LoadingIndicator
 from textual.reactive import reactive
 from textual.widget import Widget
+from textual.worker import Worker
 from textual import events
 
 from ..models import Playlist, Video
 from .search_input import SearchInput, SearchHighlighter
 
+# Byte translation that flips a 0/1 mark bitmap in a single C-level pass.
+_INVERT_MARKS = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+# Precomputed row class strings, indexed by state flags, so rendering a row does
+# not build and join a fresh class list.
+_PLAYLIST_ROW_CLASSES = {
+    (selected, match): " ".join(
+        ["playlist-item"]
+        + (["selected"] if selected else [])
+        + (["search-match"] if match else [])
+    )
+    for selected in (False, True)
+    for match in (False, True)
+}
+# Video rows are drawn by VideoRows, so their flags map to component classes.
+_VIDEO_ROW_COMPONENTS = {
+    (selected, marked, match): tuple(
+        (["video-rows--marked"] if marked else [])
+        + (["video-rows--search-match"] if match and not selected else [])
+        + (["video-rows--selected"] if selected and not match else [])
+        + (["video-rows--selected-search-match"] if selected and match else [])
+    )
+    for selected in (False, True)
+    for marked in (False, True)
+    for match in (False, True)
+}
+
+
+def _next_match_position(matches: List[int], index: int) -> int:
+    """Position in sorted matches of the first match after index (wrapping)."""
+    return bisect_right(matches, index) % len(matches)
+
+
+def _prev_match_position(matches: List[int], index: int) -> int:
+    """Position in sorted matches of the last match before index (wrapping)."""
+    return (bisect_left(matches, index) - 1) % len(matches)
+
 
 class PlaylistColumn(ScrollableContainer):
     """Left column showing playlists."""
@@ -66,6 +111,8 @@ class PlaylistColumn(ScrollableContainer):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.playlists: List[Playlist] = []
+        # Mounted row widgets, index-aligned with self.playlists (rebuilt by refresh_display)
+        self._row_widgets: List[Static] = []
         self.can_focus = True
         self.search_query = ""
         self.search_matches: List[int] = []
@@ -80,35 +127,41 @@ class PlaylistColumn(ScrollableContainer):
         self.playlists = playlists
         await self.refresh_display()
         
+    def _schedule_refresh(self) -> Worker[None]:
+        """Rebuild the column in a worker; a newer request cancels one still pending."""
+        return self.run_worker(self.refresh_display, exclusive=True, group="refresh",
+                               exit_on_error=False)
+        
     async def refresh_display(self) -> None:
         """Refresh the playlist display."""
         # Clear existing content
+        self._row_widgets = []
         await self.remove_children()
         
-        # Add playlist items
+        # Build every row first and mount them in one batch (one layout pass)
+        items: List[Static] = []
+        match_set = set(self.search_matches)  # O(1) per-row membership
         for i, playlist in enumerate(self.playlists):
-            classes = ["playlist-item"]
-            if i == self.selected_index:
-                classes.append("selected")
-            if i in self.search_matches:
-                classes.append("search-match")
-                
+            classes = _PLAYLIST_ROW_CLASSES[
+                i == self.selected_index, i in match_set
+            ]
             item = Static(
                 f"{playlist.title} ({playlist.item_count})",
-                classes=" ".join(classes)
+                classes=classes
             )
             item.playlist = playlist  # Attach playlist data
-            await self.mount(item)
+            items.append(item)
+        await self.mount_all(items)
+        self._row_widgets = items
             
     def watch_selected_index(self, old_value: int, new_value: int) -> None:
         """React to selection changes."""
         # Update visual selection
-        items = self.query(".playlist-item")
-        for i, item in enumerate(items):
-            if i == old_value:
-                item.remove_class("selected")
-            if i == new_value:
-                item.add_class("selected")
+        rows = self._row_widgets
+        if 0 <= old_value < len(rows):
+            rows[old_value].remove_class("selected")
+        if 0 <= new_value < len(rows):
+            rows[new_value].add_class("selected")
                 
         # Notify parent
         if 0 <= new_value < len(self.playlists):
@@ -126,7 +179,12 @@ class PlaylistColumn(ScrollableContainer):
         self.selected_index = new_index
         
         # Scroll to show selected item
-        self.scroll_to_widget(self.query(".playlist-item")[new_index])
+        self._scroll_to_row(new_index)
+        
+    def _scroll_to_row(self, index: int) -> None:
+        """Scroll the mounted row for a playlist index into view."""
+        if 0 <= index < len(self._row_widgets):
+            self.scroll_to_widget(self._row_widgets[index])
         
     def select_first(self) -> None:
         """Select first playlist (gg)."""
@@ -155,23 +213,23 @@ class PlaylistColumn(ScrollableContainer):
         self.current_match_index = -1
         
         if not query:
-            asyncio.create_task(self.refresh_display())
+            self._schedule_refresh()
             return 0
             
-        # Case-insensitive search in title
-        pattern = re.compile(re.escape(query), re.IGNORECASE)
+        # Case-insensitive search in title (the same rule the highlighter uses)
+        matches = SearchHighlighter.matches
         
         for i, playlist in enumerate(self.playlists):
-            if pattern.search(playlist.title):
+            if matches(playlist.title, query):
                 self.search_matches.append(i)
                 
         # Jump to first match
         if self.search_matches:
             self.current_match_index = 0
             self.selected_index = self.search_matches[0]
-            self.scroll_to_widget(self.query(".playlist-item")[self.search_matches[0]])
+            self._scroll_to_row(self.search_matches[0])
             
-        asyncio.create_task(self.refresh_display())
+        self._schedule_refresh()
         return len(self.search_matches)
         
     def next_search_match(self) -> bool:
@@ -183,9 +241,9 @@ class PlaylistColumn(ScrollableContainer):
         if not self.search_matches:
             return False
             
-        self.current_match_index = (self.current_match_index + 1) % len(self.search_matches)
+        self.current_match_index = _next_match_position(self.search_matches, self.selected_index)
         self.selected_index = self.search_matches[self.current_match_index]
-        self.scroll_to_widget(self.query(".playlist-item")[self.selected_index])
+        self._scroll_to_row(self.selected_index)
         return True
         
     def previous_search_match(self) -> bool:
@@ -197,9 +255,9 @@ class PlaylistColumn(ScrollableContainer):
         if not self.search_matches:
             return False
             
-        self.current_match_index = (self.current_match_index - 1) % len(self.search_matches)
+        self.current_match_index = _prev_match_position(self.search_matches, self.selected_index)
         self.selected_index = self.search_matches[self.current_match_index]
-        self.scroll_to_widget(self.query(".playlist-item")[self.selected_index])
+        self._scroll_to_row(self.selected_index)
         return True
         
     def clear_search(self) -> None:
@@ -207,47 +265,120 @@ class PlaylistColumn(ScrollableContainer):
         self.search_query = ""
         self.search_matches = []
         self.current_match_index = -1
-        asyncio.create_task(self.refresh_display())
+        self._schedule_refresh()
 
 
-class VideoColumn(ScrollableContainer):
-    """Middle column showing videos in selected playlist."""
-    
-    DEFAULT_CSS = """
-    VideoColumn {
-        width: 1fr;
-        height: 100%;
-        border-right: solid $accent;
-        padding: 0 1;
+class VideoRows(Widget):
+    """A page of video rows drawn through the line API.
+
+    One widget owns every row on the page instead of a Static per video, so a
+    page costs one widget's CSS/layout, only visible lines are rendered, and a
+    selection move repaints two lines.
+    """
+
+    COMPONENT_CLASSES = {
+        "video-rows--selected",
+        "video-rows--marked",
+        "video-rows--search-match",
+        "video-rows--selected-search-match",
     }
-    
-    VideoColumn > .video-item {
+
+    DEFAULT_CSS = """
+    VideoRows {
         width: 100%;
-        height: 1;
-        padding: 0 1;
+        height: auto;
     }
-    
-    VideoColumn > .video-item.selected {
+
+    VideoRows > .video-rows--selected {
         background: $primary;
         color: $text;
     }
-    
-    VideoColumn > .video-item.marked {
-        text-style: bold;
-    }
-    
-    VideoColumn > .video-item.focused {
-        background: $accent;
+
+    VideoRows > .video-rows--marked {
         text-style: bold;
     }
-    
-    VideoColumn > .video-item.search-match {
+
+    VideoRows > .video-rows--search-match {
         background: $warning-darken-2;
     }
-    
-    VideoColumn > .video-item.selected.search-match {
+
+    VideoRows > .video-rows--selected-search-match {
         background: $warning;
     }
+    """
+
+    def __init__(self, column: "VideoColumn", start: int, end: int, **kwargs: Any) -> None:
+        """Initialize the rows widget.
+
+        Args:
+            column: VideoColumn that owns the video list and row state
+            start: Index of the first video on the page
+            end: Index one past the last video on the page
+        """
+        super().__init__(**kwargs)
+        self.column = column
+        self.start = start
+        self.end = end
+        self._row_styles: Dict[Tuple[bool, bool, bool], Style] = {}
+
+    def get_content_height(self, container: Size, viewport: Size, width: int) -> int:
+        """One line per video on the page."""
+        return self.end - self.start
+
+    def notify_style_update(self) -> None:
+        """Drop cached row styles when CSS (e.g. the theme) changes."""
+        self._row_styles.clear()
+        super().notify_style_update()
+
+    def _row_style(self, state: Tuple[bool, bool, bool]) -> Style:
+        """Resolve (and cache) the style for a row state."""
+        style = self._row_styles.get(state)
+        if style is None:
+            style = self.rich_style
+            for component in _VIDEO_ROW_COMPONENTS[state]:
+                style += self.get_component_rich_style(component)
+            self._row_styles[state] = style
+        return style
+
+    def render_line(self, y: int) -> Strip:
+        """Render the row at line y of the page."""
+        width = self.size.width
+        index = self.start + y
+        if not self.start <= index < self.end:
+            return Strip.blank(width, self.rich_style)
+
+        markup, state = self.column.render_row(index)
+        style = self._row_style(state)
+        try:
+            text = Text.from_markup(markup, end="")
+        except MarkupError:
+            text = Text(markup, end="")
+        text.pad_left(1)  # Row padding; the style extends to the right edge below
+        strip = Strip(list(text.render(self.app.console)), text.cell_len)
+        return strip.apply_style(style).extend_cell_length(width, style).crop(0, width)
+
+    def refresh_row(self, index: int) -> None:
+        """Repaint the line for a video index if it is on this page."""
+        self.refresh_rows(index, index)
+
+    def refresh_rows(self, first: int, last: int) -> None:
+        """Repaint the lines for video indices first..last (inclusive) on this page."""
+        first = max(first, self.start)
+        last = min(last, self.end - 1)
+        if first <= last:
+            self.refresh(Region(0, first - self.start, self.size.width, last - first + 1))
+
+
+class VideoColumn(ScrollableContainer):
+    """Middle column showing videos in selected playlist."""
+    
+    DEFAULT_CSS = """
+    VideoColumn {
+        width: 1fr;
+        height: 100%;
+        border-right: solid $accent;
+        padding: 0 1;
+    }
     
     VideoColumn > .empty-message {
         width: 100%;
@@ -273,9 +404,17 @@ class VideoColumn(ScrollableContainer):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.videos: List[Video] = []
+        # Mark state lives in a bitmap parallel to self.videos (1 = marked) so bulk
+        # mark operations run as single bytearray calls instead of per-Video loops.
+        # Video.is_marked is only written back when the video list is replaced.
+        self._marked = bytearray()
         self.can_focus = True
         self.search_query = ""
         self.search_matches: List[int] = []
+        # Per-row membership mask for search_matches so row rendering is an O(1) lookup
+        self._match_mask = bytearray()
+        # Line-API widget drawing the current page (None while nothing is mounted)
+        self._rows: Optional[VideoRows] = None
         self.current_match_index = -1
         self.visual_mode = False
         self.visual_start_index = -1
@@ -292,7 +431,10 @@ class VideoColumn(ScrollableContainer):
         
     async def set_videos(self, videos: List[Video]) -> None:
         """Set the videos to display."""
+        self._sync_marks()
         self.videos = videos
+        self._marked = bytearray(video.is_marked for video in videos)
+        self._set_search_matches([i for i in self.search_matches if i < len(videos)])
         self.selected_index = 0 if videos else -1
         
         # Calculate pagination
@@ -301,8 +443,14 @@ class VideoColumn(ScrollableContainer):
         
         await self.refresh_display()
         
+    def _schedule_refresh(self) -> Worker[None]:
+        """Rebuild the column in a worker; a newer request cancels one still pending."""
+        return self.run_worker(self.refresh_display, exclusive=True, group="refresh",
+                               exit_on_error=False)
+        
     async def refresh_display(self) -> None:
         """Refresh the video display."""
+        self._rows = None
         await self.remove_children()
         
         if not self.videos:
@@ -313,57 +461,56 @@ class VideoColumn(ScrollableContainer):
         start_idx = self.current_page * self.page_size
         end_idx = min(start_idx + self.page_size, len(self.videos))
         
+        # Build the whole page first and mount it in one batch (one layout pass)
+        items: List[Widget] = []
+        
         # Show page info if we have multiple pages
         if self.total_pages > 1:
             page_info = f"Page {self.current_page + 1}/{self.total_pages} (Videos {start_idx + 1}-{end_idx} of {len(self.videos)})"
-            await self.mount(Static(page_info, classes="page-info"))
+            items.append(Static(page_info, classes="page-info"))
             
-        # Calculate visual range if in visual mode
-        visual_range = set()
+        # Only display videos on current page; rows are drawn on demand by render_row
+        rows = VideoRows(self, start_idx, end_idx)
+        items.append(rows)
+        await self.mount_all(items)
+        self._rows = rows
+        
+    def render_row(self, i: int) -> Tuple[str, Tuple[bool, bool, bool]]:
+        """Build the display markup and state flags for video i.
+        
+        Returns:
+            Tuple of (markup text, (selected, marked, search match))
+        """
+        # Visual range bounds if in visual mode (empty range otherwise)
+        in_visual = False
         if self.visual_mode and self.visual_start_index >= 0:
-            start = min(self.visual_start_index, self.selected_index)
-            end = max(self.visual_start_index, self.selected_index)
-            visual_range = set(range(start, end + 1))
-            
-        # Only display videos on current page
-        for i in range(start_idx, end_idx):
-            video = self.videos[i]
-            classes = ["video-item"]
-            if i == self.selected_index:
-                classes.append("selected")
-            if video.is_marked or i in visual_range:
-                classes.append("marked")
-            if i in self.search_matches:
-                classes.append("search-match")
-                
-            # Format display text
-            # In visual unmark mode, show different indicator
-            if self.visual_unmark_mode and i in visual_range:
-                marker = "✗ "  # X mark for items to be unmarked
-            elif video.is_marked or i in visual_range:
-                marker = "◆ "  # Diamond for marked/to-be-marked
-            else:
-                marker = "  "
-            title = video.title
+            visual_start = min(self.visual_start_index, self.selected_index)
+            visual_end = max(self.visual_start_index, self.selected_index)
+            in_visual = visual_start <= i <= visual_end
+        is_match = self._match_mask[i] == 1
+        is_marked = self._marked[i] == 1
             
-            # Highlight search matches
-            if self.search_query and i in self.search_matches:
-                title = SearchHighlighter.highlight(title, self.search_query)
-                
-            text = f"{marker}{title}"
+        # Format display text
+        # In visual unmark mode, show different indicator
+        if self.visual_unmark_mode and in_visual:
+            marker = "✗ "  # X mark for items to be unmarked
+        elif is_marked or in_visual:
+            marker = "◆ "  # Diamond for marked/to-be-marked
+        else:
+            marker = "  "
+        title = self.videos[i].title
+        
+        # Highlight search matches
+        if self.search_query and is_match:
+            title = SearchHighlighter.highlight(title, self.search_query)
             
-            item = Static(text, classes=" ".join(classes))
-            item.video = video  # Attach video data
-            await self.mount(item)
+        return f"{marker}{title}", (i == self.selected_index, is_marked or in_visual, is_match)
             
     def watch_selected_index(self, old_value: int, new_value: int) -> None:
         """React to selection changes."""
-        items = self.query(".video-item")
-        for i, item in enumerate(items):
-            if i == old_value:
-                item.remove_class("selected")
-            if i == new_value:
-                item.add_class("selected")
+        if self._rows is not None:
+            self._rows.refresh_row(old_value)
+            self._rows.refresh_row(new_value)
                 
         if 0 <= new_value < len(self.videos):
             self.post_message(
@@ -389,12 +536,13 @@ class VideoColumn(ScrollableContainer):
             self.current_page = new_page
             self.call_later(self.refresh_display)
         else:
-            # Find the item index on current page
-            page_start = self.current_page * self.page_size
-            item_index = new_index - page_start
-            items = self.query(".video-item")
-            if 0 <= item_index < len(items):
-                self.scroll_to_widget(items[item_index])
+            # Scroll the selected line of the page into view
+            rows = self._rows
+            if rows is not None and rows.start <= new_index < rows.end:
+                region = rows.virtual_region
+                self.scroll_to_region(
+                    Region(region.x, region.y + new_index - rows.start, region.width, 1)
+                )
         
     def select_first(self) -> None:
         """Select first video (gg)."""
@@ -428,19 +576,27 @@ class VideoColumn(ScrollableContainer):
     def toggle_mark(self) -> None:
         """Toggle mark on current video (Space)."""
         if 0 <= self.selected_index < len(self.videos):
-            video = self.videos[self.selected_index]
-            video.is_marked = not video.is_marked
-            asyncio.create_task(self.refresh_display())
+            self._marked[self.selected_index] ^= 1
+            # Rows read marks from _marked, so only this line changes
+            self._repaint_rows(self.selected_index, self.selected_index)
             
     def get_marked_videos(self) -> List[Video]:
         """Get all marked videos."""
-        return [v for v in self.videos if v.is_marked]
+        return list(compress(self.videos, self._marked))
+    
+    def get_marked_count(self) -> int:
+        """Get the number of marked videos without building a list."""
+        return self._marked.count(1)
     
     def clear_marks(self) -> None:
         """Clear all marks."""
-        for video in self.videos:
-            video.is_marked = False
-        asyncio.create_task(self.refresh_display())
+        self._marked = bytearray(len(self.videos))
+        self.repaint_page()
+    
+    def _sync_marks(self) -> None:
+        """Write the mark bitmap back onto the Video objects it shadows."""
+        for video, marked in zip(self.videos, self._marked, strict=True):
+            video.is_marked = bool(marked)
         
     def search(self, query: str) -> int:
         """Search for videos matching query.
@@ -452,19 +608,20 @@ class VideoColumn(ScrollableContainer):
             Number of matches found
         """
         self.search_query = query
-        self.search_matches = []
+        self._set_search_matches([])
         self.current_match_index = -1
         
         if not query:
-            asyncio.create_task(self.refresh_display())
+            self._schedule_refresh()
             return 0
             
-        # Case-insensitive search in title and channel
-        pattern = re.compile(re.escape(query), re.IGNORECASE)
+        # Case-insensitive search in title and channel (the same rule the highlighter uses)
+        matches = SearchHighlighter.matches
         
-        for i, video in enumerate(self.videos):
-            if pattern.search(video.title) or (video.channel_title and pattern.search(video.channel_title)):
-                self.search_matches.append(i)
+        self._set_search_matches([
+            i for i, video in enumerate(self.videos)
+            if matches(video.title, query) or (video.channel_title and matches(video.channel_title, query))
+        ])
                 
         # Jump to first match
         if self.search_matches:
@@ -476,7 +633,7 @@ class VideoColumn(ScrollableContainer):
             if new_page != self.current_page:
                 self.current_page = new_page
             
-        asyncio.create_task(self.refresh_display())
+        self._schedule_refresh()
         return len(self.search_matches)
         
     def next_match(self) -> bool:
@@ -488,7 +645,7 @@ class VideoColumn(ScrollableContainer):
         if not self.search_matches:
             return False
             
-        self.current_match_index = (self.current_match_index + 1) % len(self.search_matches)
+        self.current_match_index = _next_match_position(self.search_matches, self.selected_index)
         self.selected_index = self.search_matches[self.current_match_index]
         
         # Update page if necessary to show the selected match
@@ -496,7 +653,7 @@ class VideoColumn(ScrollableContainer):
         if new_page != self.current_page:
             self.current_page = new_page
             
-        asyncio.create_task(self.refresh_display())
+        self._schedule_refresh()
         return True
         
     def prev_match(self) -> bool:
@@ -508,7 +665,7 @@ class VideoColumn(ScrollableContainer):
         if not self.search_matches:
             return False
             
-        self.current_match_index = (self.current_match_index - 1) % len(self.search_matches)
+        self.current_match_index = _prev_match_position(self.search_matches, self.selected_index)
         self.selected_index = self.search_matches[self.current_match_index]
         
         # Update page if necessary to show the selected match
@@ -516,15 +673,15 @@ class VideoColumn(ScrollableContainer):
         if new_page != self.current_page:
             self.current_page = new_page
             
-        asyncio.create_task(self.refresh_display())
+        self._schedule_refresh()
         return True
         
     def clear_search(self) -> None:
         """Clear search highlighting."""
         self.search_query = ""
-        self.search_matches = []
+        self._set_search_matches([])
         self.current_match_index = -1
-        asyncio.create_task(self.refresh_display())
+        self._schedule_refresh()
         
     def enter_visual_mode(self, unmark_mode: bool = False) -> None:
         """Enter visual mode for range selection.
@@ -535,7 +692,8 @@ class VideoColumn(ScrollableContainer):
         self.visual_mode = True
         self.visual_start_index = self.selected_index
         self.visual_unmark_mode = unmark_mode
-        asyncio.create_task(self.refresh_display())
+        # The range starts as just the current row, so only its line changes
+        self._repaint_rows(self.selected_index, self.selected_index)
         
     def exit_visual_mode(self, mark_selection: bool = True) -> None:
         """Exit visual mode and optionally mark/unmark the selection.
@@ -543,37 +701,56 @@ class VideoColumn(ScrollableContainer):
         Args:
             mark_selection: Whether to apply marks/unmarks to the selected range
         """
-        if self.visual_mode and mark_selection and self.visual_start_index >= 0:
-            # Mark or unmark all videos in the visual range
+        start, end = 0, -1
+        if self.visual_mode and self.visual_start_index >= 0:
             start = min(self.visual_start_index, self.selected_index)
-            end = max(self.visual_start_index, self.selected_index)
-            for i in range(start, end + 1):
-                if i < len(self.videos):
-                    # Set mark based on mode (mark for V, unmark for uV)
-                    self.videos[i].is_marked = not self.visual_unmark_mode
+            end = min(max(self.visual_start_index, self.selected_index), len(self.videos) - 1)
+            
+        if mark_selection and end >= start:
+            # Mark or unmark all videos in the visual range
+            # Set mark based on mode (mark for V, unmark for uV)
+            value = b"\x00" if self.visual_unmark_mode else b"\x01"
+            self._marked[start:end + 1] = value * (end + 1 - start)
                     
         self.visual_mode = False
         self.visual_start_index = -1
         self.visual_unmark_mode = False
-        asyncio.create_task(self.refresh_display())
+        # Only rows inside the former visual range change appearance
+        if end >= start:
+            self._repaint_rows(start, end)
+        
+    def repaint_page(self) -> None:
+        """Repaint every row of the current page without rebuilding widgets."""
+        self._repaint_rows(0, len(self.videos) - 1)
+        
+    def _repaint_rows(self, first: int, last: int) -> None:
+        """Repaint rows first..last, rebuilding the page only if none is mounted."""
+        if self._rows is None:
+            self._schedule_refresh()
+        else:
+            self._rows.refresh_rows(first, last)
         
     def select_all(self) -> None:
         """Mark all videos (V command)."""
-        for video in self.videos:
-            video.is_marked = True
-        asyncio.create_task(self.refresh_display())
+        self._marked = bytearray(b"\x01" * len(self.videos))
+        self.repaint_page()
         
     def unselect_all(self) -> None:
         """Unmark all videos (uv command)."""
-        for video in self.videos:
-            video.is_marked = False
-        asyncio.create_task(self.refresh_display())
+        self._marked = bytearray(len(self.videos))
+        self.repaint_page()
         
     def invert_selection(self) -> None:
         """Invert selection - marked become unmarked, unmarked become marked."""
-        for video in self.videos:
-            video.is_marked = not video.is_marked
-        asyncio.create_task(self.refresh_display())
+        self._marked = self._marked.translate(_INVERT_MARKS)
+        self.repaint_page()
+    
+    def _set_search_matches(self, matches: List[int]) -> None:
+        """Replace the sorted match list and rebuild its per-row mask."""
+        self.search_matches = matches
+        self._match_mask = bytearray(len(self.videos))
+        for i in matches:
+            self._match_mask[i] = 1
 
 
 class PreviewPane(ScrollableContainer):
@@ -637,25 +814,28 @@ class PreviewPane(ScrollableContainer):
         """Display video information."""
         await self.remove_children()
         
+        # Build the metadata fields first and mount them in one batch
+        fields: List[Static] = []
+        
         # Title
-        await self.mount(Static(video.title, classes="preview-title"))
+        fields.append(Static(video.title, classes="preview-title"))
         
         # Channel
-        await self.mount(Static(
+        fields.append(Static(
             f"[dim]Channel:[/dim] {video.channel_title}",
             classes="preview-field"
         ))
         
         # Duration
         if video.duration:
-            await self.mount(Static(
+            fields.append(Static(
                 f"[dim]Duration:[/dim] {video.format_duration()}",
                 classes="preview-field"
             ))
         
         # Views
         if video.view_count is not None:
-            await self.mount(Static(
+            fields.append(Static(
                 f"[dim]Views:[/dim] {video.format_view_count()}",
                 classes="preview-field"
             ))
@@ -663,14 +843,14 @@ class PreviewPane(ScrollableContainer):
         # Added date
         if video.added_at:
             date_str = video.added_at.strftime("%Y-%m-%d")
-            await self.mount(Static(
+            fields.append(Static(
                 f"[dim]Added:[/dim] {date_str}",
                 classes="preview-field"
             ))
         
         # Description
         if video.description:
-            await self.mount(Static(
+            fields.append(Static(
                 "[dim]Description:[/dim]",
                 classes="preview-field"
             ))
@@ -678,34 +858,54 @@ class PreviewPane(ScrollableContainer):
             desc = video.description[:500]
             if len(video.description) > 500:
                 desc += "..."
-            await self.mount(Static(desc, classes="preview-field"))
+            fields.append(Static(desc, classes="preview-field"))
+
+        await self.mount_all(fields)
 
         # Transcript (if enabled and cached)
         if self.cache and self.settings and self.settings.transcripts.enabled:
             transcript_data = self.cache.get_transcript(video.id)
             if transcript_data and transcript_data['fetch_status'] == 'SUCCESS':
+                mounted: List[Widget] = []
                 try:
                     from ..core.transcript_fetcher import TranscriptFetcher
 
-                    # Decompress transcript text
-                    text = TranscriptFetcher.decompress_transcript(transcript_data['transcript_text'])
+                    # Type string
+                    type_str = "auto-generated" if transcript_data['auto_generated'] else "manual"
+                    header = f"[dim]Transcript ({transcript_data['language']}, {type_str}):[/dim]"
 
-                    # Format for display
+                    # Mount a placeholder so the metadata above paints immediately
+                    body = Static("[dim]Loading transcript…[/dim]", classes="preview-field")
+                    mounted = [Static(header, classes="preview-transcript"), body]
+                    await self.mount_all(mounted)
+
+                    # Decompress off the event loop; large transcripts would stall rendering.
+                    # Only the displayed head is inflated, not the whole transcript.
                     max_chars = 1000
+                    text = await asyncio.to_thread(
+                        TranscriptFetcher.decompress_transcript,
+                        transcript_data['transcript_text'],
+                        max_chars,
+                    )
+
+                    # A newer show_video call may have replaced this preview meanwhile
+                    if not body.is_attached:
+                        return
+
+                    # Format for display
                     if len(text) > max_chars:
                         text = text[:max_chars] + "..."
 
-                    # Type string
-                    type_str = "auto-generated" if transcript_data['auto_generated'] else "manual"
-                    header = f"[dim]Transcript ({transcript_data['language']}, {type_str}):[/dim]"
-
-                    await self.mount(Static(header, classes="preview-transcript"))
-                    await self.mount(Static(text, classes="preview-field"))
+                    body.update(text)
 
                 except Exception as e:
-                    # Silently fail if transcript display fails
+                    # Silently fail if transcript display fails: drop the header and
+                    # placeholder (unless a newer preview already replaced them)
                     import logging
                     logging.getLogger(__name__).warning(f"Failed to display transcript: {e}")
+                    for widget in mounted:
+                        if widget.is_attached:
+                            await widget.remove()
 
 
 class MillerView(Widget):
@@ -732,6 +932,7 @@ class MillerView(Widget):
         self.search_input: Optional[SearchInput] = None
         self.search_active = False
         self.pending_u_command = False  # For 'uv' command
+        self._refresh_pending = False  # A visual-range repaint is already queued
         
     def compose(self) -> ComposeResult:
         """Create the three columns."""
@@ -755,6 +956,7 @@ class MillerView(Widget):
     async def show_loading_playlists(self) -> None:
         """Show loading state in playlist column."""
         if self.playlist_column:
+            self.playlist_column._row_widgets = []
             await self.playlist_column.remove_children()
             loading = LoadingIndicator()
             await self.playlist_column.mount(loading)
@@ -766,6 +968,7 @@ class MillerView(Widget):
             message: Optional custom loading message
         """
         if self.video_column:
+            self.video_column._rows = None
             await self.video_column.remove_children()
             loading = LoadingIndicator()
             # Update loading message if LoadingIndicator supports it
@@ -791,7 +994,7 @@ class MillerView(Widget):
     def get_marked_count(self) -> int:
         """Get count of marked videos in current column."""
         if self.video_column:
-            return len(self.video_column.get_marked_videos())
+            return self.video_column.get_marked_count()
         return 0
         
     def on_search_submit(self, query: str) -> None:
@@ -842,175 +1045,225 @@ class MillerView(Widget):
             
     async def handle_key(self, key: str) -> None:
         """Handle vim-style navigation keys."""
-        # Handle 'u' prefix for 'uv' and 'uV' commands
+        # 'u' prefix for 'uv' and 'uV'; everything else, j/k included, goes straight
+        # to the jump table after these two cheap checks
         if key == 'u' and self.focused_column == 1:
             self.pending_u_command = True
             return
-        elif self.pending_u_command:
-            if key == 'v' and self.video_column:
-                # Unselect all (uv) - clear all marks
-                self.video_column.unselect_all()
-                self.post_message(MarksChanged(0))
-            elif key == 'V' and self.video_column:
-                # Visual unmark mode (uV) - enter visual mode but for unmarking
-                if not self.video_column.visual_mode:
-                    self.video_column.enter_visual_mode(unmark_mode=True)
-            self.pending_u_command = False
+        if self.pending_u_command:
+            self._finish_u_command(key)
             return
             
-        # Visual mode (uppercase V like ranger)
-        if key == 'V' and self.focused_column == 1 and self.video_column:
-            if self.video_column.visual_mode:
-                # Exit visual mode and apply marks/unmarks
-                self.video_column.exit_visual_mode(mark_selection=True)
-                self.post_message(MarksChanged(self.get_marked_count()))
-            else:
-                # Enter visual mode for marking
-                self.video_column.enter_visual_mode(unmark_mode=False)
-            return
-        elif key == 'v' and self.focused_column == 1 and self.video_column:
-            # lowercase v - invert selection (mark unmarked, unmark marked)
-            self.video_column.invert_selection()
-            self.post_message(MarksChanged(self.get_marked_count()))
-            return
-        elif key == 'escape' and self.video_column and self.video_column.visual_mode:
-            # Cancel visual mode without marking
-            self.video_column.exit_visual_mode(mark_selection=False)
-            return
-            
-        # Search mode - handle n/N for both playlist and video columns
-        elif key == 'n' and self.search_active:
-            # Next search match
-            if self.focused_column == 0 and self.playlist_column:
-                # Search in playlist column
-                if self.playlist_column.next_search_match():
-                    self.post_message(SearchStatusUpdate(
-                        self.playlist_column.current_match_index + 1,
-                        len(self.playlist_column.search_matches)
-                    ))
-            elif self.focused_column == 1 and self.video_column:
-                # Search in video column
-                if self.video_column.next_match():
-                    self.post_message(SearchStatusUpdate(
-                        self.video_column.current_match_index + 1,
-                        len(self.video_column.search_matches)
-                    ))
-            return
-        elif key == 'N' and self.search_active:
-            # Previous search match
-            if self.focused_column == 0 and self.playlist_column:
-                # Search in playlist column
-                if self.playlist_column.previous_search_match():
-                    self.post_message(SearchStatusUpdate(
-                        self.playlist_column.current_match_index + 1,
-                        len(self.playlist_column.search_matches)
-                    ))
-            elif self.focused_column == 1 and self.video_column:
-                # Search in video column
-                if self.video_column.prev_match():
-                    self.post_message(SearchStatusUpdate(
-                        self.video_column.current_match_index + 1,
-                        len(self.video_column.search_matches)
-                    ))
-            return
-            
-        # Column navigation
-        if key in ['h', 'left']:  # Move left
-            self.focused_column = max(0, self.focused_column - 1)
-        elif key in ['l', 'right']:  # Move right
-            self.focused_column = min(2, self.focused_column + 1)
+        handler = self._KEY_TABLE.get(key)
+        if handler is not None:
+            handler(self)
             
-        # Enter key - trigger selection
-        elif key == 'enter':
-            if self.focused_column == 0 and self.playlist_column:
-                # Trigger playlist selection
-                if 0 <= self.playlist_column.selected_index < len(self.playlist_column.playlists):
-                    playlist = self.playlist_column.playlists[self.playlist_column.selected_index]
-                    self.post_message(PlaylistSelected(playlist))
-            elif self.focused_column == 1 and self.video_column:
-                # Trigger video selection
-                if 0 <= self.video_column.selected_index < len(self.video_column.videos):
-                    video = self.video_column.videos[self.video_column.selected_index]
-                    self.post_message(VideoSelected(video))
-                    
-        # Space key - toggle mark on video (NO auto-advance like real ranger)
-        elif key == 'space' and self.focused_column == 1 and self.video_column:
+    def _finish_u_command(self, key: str) -> None:
+        """Complete a 'u' prefix: uv unselects all, uV starts visual unmark mode."""
+        self.pending_u_command = False
+        video_column = self.video_column
+        if key == 'v' and video_column:
+            # Unselect all (uv) - clear all marks
+            video_column.unselect_all()
+            self.post_message(MarksChanged(0))
+        elif key == 'V' and video_column:
+            # Visual unmark mode (uV) - enter visual mode but for unmarking
+            if not video_column.visual_mode:
+                video_column.enter_visual_mode(unmark_mode=True)
+                
+    def _key_left(self) -> None:
+        """Move focus one column left (h / left)."""
+        self.focused_column = max(0, self.focused_column - 1)
+        
+    def _key_right(self) -> None:
+        """Move focus one column right (l / right)."""
+        self.focused_column = min(2, self.focused_column + 1)
+        
+    def _key_enter(self) -> None:
+        """Trigger selection of the current item (enter)."""
+        if self.focused_column == 0 and self.playlist_column:
+            # Trigger playlist selection. The bounds check stays: set_playlists keeps
+            # selected_index, so it can point past a list that has since shrunk.
+            playlists = self.playlist_column.playlists
+            index = self.playlist_column.selected_index
+            if 0 <= index < len(playlists):
+                self.post_message(PlaylistSelected(playlists[index]))
+        elif self.focused_column == 1 and self.video_column:
+            # Trigger video selection (selected_index is -1 for an empty column)
+            videos = self.video_column.videos
+            index = self.video_column.selected_index
+            if 0 <= index < len(videos):
+                self.post_message(VideoSelected(videos[index]))
+                
+    def _key_space(self) -> None:
+        """Toggle mark on video (NO auto-advance like real ranger)."""
+        if self.focused_column == 1 and self.video_column:
             self.video_column.toggle_mark()
             # Don't move cursor - ranger doesn't auto-advance on spacebar
             # Notify about mark change
             self.post_message(MarksChanged(self.get_marked_count()))
             
-        # Ranger-style commands
-        elif key == 'd' and self.focused_column == 1 and self.video_column:
-            # Handle dd (cut) - wait for second 'd'
+    def _key_cut(self) -> None:
+        """Handle dd (cut) - wait for second 'd'."""
+        if self.focused_column == 1 and self.video_column:
             self.post_message(RangerCommand('d'))
-        elif key == 'y' and self.focused_column == 1 and self.video_column:
-            # Handle yy (copy) - wait for second 'y'
+            
+    def _key_copy(self) -> None:
+        """Handle yy (copy) - wait for second 'y'."""
+        if self.focused_column == 1 and self.video_column:
             self.post_message(RangerCommand('y'))
-        elif key == 'p' and self.focused_column == 1:
-            # Handle pp (paste) - wait for second 'p'
+            
+    def _key_paste(self) -> None:
+        """Handle pp (paste) - wait for second 'p'."""
+        if self.focused_column == 1:
             self.post_message(RangerCommand('p'))
-        elif key == 'o' and self.focused_column == 1 and self.video_column:
-            # Handle sort menu
+            
+    def _key_sort(self) -> None:
+        """Handle sort menu (o)."""
+        if self.focused_column == 1 and self.video_column:
             self.post_message(SortMenuRequest())
+            
+    def _step_search(self, forward: bool) -> None:
+        """Jump to the next/previous search match in the focused column (n / N)."""
+        if not self.search_active:
+            return
+        column: Optional[Union[PlaylistColumn, VideoColumn]] = None
+        moved = False
+        if self.focused_column == 0 and self.playlist_column:
+            column = self.playlist_column
+            moved = (column.next_search_match() if forward
+                     else column.previous_search_match())
+        elif self.focused_column == 1 and self.video_column:
+            column = self.video_column
+            moved = column.next_match() if forward else column.prev_match()
+        if column is not None and moved:
+            self.post_message(SearchStatusUpdate(
+                column.current_match_index + 1,
+                len(column.search_matches)
+            ))
+            
+    def _key_next_match(self) -> None:
+        """Next search match (n)."""
+        self._step_search(forward=True)
+        
+    def _key_prev_match(self) -> None:
+        """Previous search match (N)."""
+        self._step_search(forward=False)
         
-        # Search navigation - 'n' and 'N'
-        elif key == 'n' and self.search_active:
-            # Next search match
-            if self.focused_column == 0 and self.playlist_column:
-                self.playlist_column.next_search_match()
-            elif self.focused_column == 1 and self.video_column:
-                self.video_column.next_search_match()
-        elif key == 'N' and self.search_active:
-            # Previous search match
-            if self.focused_column == 0 and self.playlist_column:
-                self.playlist_column.previous_search_match()
-            elif self.focused_column == 1 and self.video_column:
-                self.video_column.previous_search_match()
-        
-        # Cancel search with escape
-        elif key == 'escape' and self.search_active:
+    def _key_visual(self) -> None:
+        """Toggle visual mode (uppercase V like ranger)."""
+        if self.focused_column == 1 and self.video_column:
+            if self.video_column.visual_mode:
+                # Exit visual mode and apply marks/unmarks
+                self.video_column.exit_visual_mode(mark_selection=True)
+                self.post_message(MarksChanged(self.get_marked_count()))
+            else:
+                # Enter visual mode for marking
+                self.video_column.enter_visual_mode(unmark_mode=False)
+                
+    def _key_invert(self) -> None:
+        """Invert selection (lowercase v): mark unmarked, unmark marked."""
+        if self.focused_column == 1 and self.video_column:
+            self.video_column.invert_selection()
+            self.post_message(MarksChanged(self.get_marked_count()))
+            
+    def _key_escape(self) -> None:
+        """Cancel visual mode without marking, otherwise cancel search."""
+        if self.video_column and self.video_column.visual_mode:
+            self.video_column.exit_visual_mode(mark_selection=False)
+        elif self.search_active:
             self.on_search_cancel()
             if self.search_input:
                 self.search_input.hide()
-                    
-        # Vertical navigation in focused column
-        elif key in ['j', 'down', 'k', 'up', 'g', 'G']:
-            if self.focused_column == 0 and self.playlist_column:
-                if key in ['j', 'down']:
-                    self.playlist_column.move_selection(1)
-                elif key in ['k', 'up']:
-                    self.playlist_column.move_selection(-1)
-                elif key == 'g':
-                    self.playlist_column.select_first()
-                elif key == 'G':
-                    self.playlist_column.select_last()
-
-            elif self.focused_column == 1 and self.video_column:
-                # In visual mode, just update selection to expand range
-                if key in ['j', 'down']:
-                    self.video_column.move_selection(1)
-                elif key in ['k', 'up']:
-                    self.video_column.move_selection(-1)
-                elif key == 'g':
-                    self.video_column.select_first()
-                elif key == 'G':
-                    self.video_column.select_last()
-                # Refresh to show visual range updates
-                if self.video_column.visual_mode:
-                    asyncio.create_task(self.video_column.refresh_display())
-        
-        # Page navigation for video column
-        elif key in ['pageup', 'pagedown'] and self.focused_column == 1 and self.video_column:
-            if key == 'pagedown':
-                self.video_column.next_page()
-            elif key == 'pageup':
-                self.video_column.prev_page()
+                
+    def _navigate(self, action: str, *args: int) -> None:
+        """Run a vertical navigation action on the focused list column.
+        
+        Args:
+            action: Column method name (move_selection, select_first, select_last)
+            *args: Arguments for that method
+        """
+        if self.focused_column == 0 and self.playlist_column:
+            getattr(self.playlist_column, action)(*args)
+        elif self.focused_column == 1 and self.video_column:
+            # In visual mode, just update selection to expand range
+            getattr(self.video_column, action)(*args)
+            # Refresh to show visual range updates
+            if self.video_column.visual_mode:
+                self._schedule_visual_refresh()
+                
+    def _schedule_visual_refresh(self) -> None:
+        """Queue one visual-range repaint, coalescing bursts of key-repeat j/k."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.call_after_refresh(self._do_visual_refresh)
+        
+    def _do_visual_refresh(self) -> None:
+        """Run the queued visual-range repaint."""
+        self._refresh_pending = False
+        if self.video_column:
+            self.video_column.repaint_page()
+                
+    def _key_down(self) -> None:
+        """Move selection down (j / down)."""
+        self._navigate("move_selection", 1)
+        
+    def _key_up(self) -> None:
+        """Move selection up (k / up)."""
+        self._navigate("move_selection", -1)
+        
+    def _key_top(self) -> None:
+        """Select first item (g)."""
+        self._navigate("select_first")
+        
+    def _key_bottom(self) -> None:
+        """Select last item (G)."""
+        self._navigate("select_last")
+        
+    def _key_page_down(self) -> None:
+        """Next page in the video column (pagedown)."""
+        if self.focused_column == 1 and self.video_column:
+            self.video_column.next_page()
+            
+    def _key_page_up(self) -> None:
+        """Previous page in the video column (pageup)."""
+        if self.focused_column == 1 and self.video_column:
+            self.video_column.prev_page()
+            
+    # Key -> handler jump table consulted by handle_key once the 'u' prefix check has
+    # passed: one dict lookup instead of an elif chain. Listed roughly by frequency.
+    _KEY_TABLE: Dict[str, Callable[["MillerView"], None]] = {
+        'j': _key_down,
+        'down': _key_down,
+        'k': _key_up,
+        'up': _key_up,
+        'h': _key_left,
+        'left': _key_left,
+        'l': _key_right,
+        'right': _key_right,
+        'enter': _key_enter,
+        'space': _key_space,
+        'g': _key_top,
+        'G': _key_bottom,
+        'pagedown': _key_page_down,
+        'pageup': _key_page_up,
+        'V': _key_visual,
+        'v': _key_invert,
+        'd': _key_cut,
+        'y': _key_copy,
+        'p': _key_paste,
+        'o': _key_sort,
+        'n': _key_next_match,
+        'N': _key_prev_match,
+        'escape': _key_escape,
+    }
 
 
 # Custom messages
 class PlaylistSelected(events.Message):
     """Message sent when a playlist is selected."""
+    __slots__ = ("playlist",)
     def __init__(self, playlist: Playlist):
         super().__init__()
         self.playlist = playlist
@@ -1018,6 +1271,7 @@ class PlaylistSelected(events.Message):
 
 class VideoSelected(events.Message):
     """Message sent when a video is selected."""
+    __slots__ = ("video",)
     def __init__(self, video: Video):
         super().__init__()
         self.video = video
@@ -1025,6 +1279,7 @@ class VideoSelected(events.Message):
 
 class RangerCommand(events.Message):
     """Message sent when a ranger-style command key is pressed."""
+    __slots__ = ("command",)
     def __init__(self, command: str):
         super().__init__()
         self.command = command
@@ -1032,6 +1287,7 @@ class RangerCommand(events.Message):
 
 class MarksChanged(events.Message):
     """Message sent when video marks change."""
+    __slots__ = ("count",)
     def __init__(self, count: int):
         super().__init__()
         self.count = count
@@ -1039,6 +1295,7 @@ class MarksChanged(events.Message):
 
 class SearchStatusUpdate(events.Message):
     """Message sent when search status changes."""
+    __slots__ = ("current", "total")
     def __init__(self, current: int, total: int):
         super().__init__()
         self.current = current
@@ -1047,4 +1304,4 @@ class SearchStatusUpdate(events.Message):
 
 class SortMenuRequest(events.Message):
     """Message sent when sort menu is requested."""
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
@@ -14,6 +14,8 @@ from textual.validation import Length
 
 class PlaylistCreated(Message):
     """Message sent when a playlist is created."""
+
+    __slots__ = ("title", "description", "privacy")
     
     def __init__(self, title: str, description: str, privacy: str) -> None:
         """Initialize the message.
@@ -108,8 +110,11 @@ class PlaylistCreationModal(ModalScreen):
                     yield Button("Cancel", variant="default", id="cancel")
     
     def on_mount(self) -> None:
-        """Focus the title input when mounted."""
-        self.query_one("#title_input", Input).focus()
+        """Look up the form fields once and focus the title input."""
+        self._title_input = self.query_one("#title_input", Input)
+        self._description_input = self.query_one("#description_input", Input)
+        self._privacy_set = self.query_one("#privacy_set", RadioSet)
+        self._title_input.focus()
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -122,15 +127,15 @@ class PlaylistCreationModal(ModalScreen):
         """Handle Enter key in input fields."""
         if event.input.id == "title_input":
             # Move to description field
-            self.query_one("#description_input", Input).focus()
+            self._description_input.focus()
         elif event.input.id == "description_input":
             # Create the playlist
             self.create_playlist()
     
     def create_playlist(self) -> None:
         """Validate and create the playlist."""
-        title_input = self.query_one("#title_input", Input)
-        description_input = self.query_one("#description_input", Input)
+        title_input = self._title_input
+        description_input = self._description_input
         
         # Validate title
         title = title_input.value.strip()
@@ -142,7 +147,7 @@ class PlaylistCreationModal(ModalScreen):
         
         # Get privacy setting
         privacy = "private"  # default
-        radio_set = self.query_one("#privacy_set", RadioSet)
+        radio_set = self._privacy_set
         if radio_set.pressed_button:
             button_id = radio_set.pressed_button.id
             if button_id == "unlisted":
@@ -14,6 +14,8 @@ from textual.validation import Length
 
 class ItemRenamed(Message):
     """Message sent when an item is renamed."""
+
+    __slots__ = ("item_type", "item_id", "old_name", "new_name")
     
     def __init__(self, item_type: str, item_id: str, old_name: str, new_name: str) -> None:
         """Initialize the message.
@@ -116,7 +118,7 @@ class RenameModal(ModalScreen):
     
     def on_mount(self) -> None:
         """Focus and select the input when mounted."""
-        name_input = self.query_one("#name_input", Input)
+        name_input = self._name_input = self.query_one("#name_input", Input)
         name_input.focus()
         # Select all text for easy replacement
         name_input.action_select_all()
@@ -134,7 +136,7 @@ class RenameModal(ModalScreen):
     
     def rename_item(self) -> None:
         """Validate and rename the item."""
-        name_input = self.query_one("#name_input", Input)
+        name_input = self._name_input
         
         # Validate new name
         new_name = name_input.value.strip()
@@ -4,8 +4,10 @@ Provides an overlay input field for searching videos.
 """
 # Modified: 2025-09-14
 
-from typing import Optional, Callable
+from functools import lru_cache
+from typing import Optional, Callable, List, Tuple
 import logging
+import re
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.widgets import Input, Static
@@ -17,6 +19,12 @@ from textual.binding import Binding
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _compile_query(query: str) -> "re.Pattern[str]":
+    """Compile (once per query) the case-insensitive literal pattern for a search."""
+    return re.compile(re.escape(query), re.IGNORECASE)
+
+
 class SearchInput(Container):
     """Search input overlay widget."""
     
@@ -135,19 +143,16 @@ class SearchInput(Container):
         if self.input_field:
             self.input_field.placeholder = placeholder
             self.input_field.value = ""
-
-            # Force styles directly on the Input widget after showing
-            self.input_field.styles.color = "white"
-            self.input_field.styles.background = "rgb(0,0,0)"
-            self.input_field.styles.text_style = "bold"
-
+            # Colours were set once in compose (and are pinned by DEFAULT_CSS), so
+            # showing the bar doesn't touch styles again
             self.input_field.focus()
 
-            # Debug: Log actual styles
-            logger.debug(f"Search input value: '{self.input_field.value}'")
-            logger.debug(f"Search color: {self.input_field.styles.color}")
-            logger.debug(f"Search background: {self.input_field.styles.background}")
-            logger.debug(f"Search has focus: {self.input_field.has_focus}")
+            # Debug: Log actual styles (skip the formatting unless debug is on)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Search input value: '{self.input_field.value}'")
+                logger.debug(f"Search color: {self.input_field.styles.color}")
+                logger.debug(f"Search background: {self.input_field.styles.background}")
+                logger.debug(f"Search has focus: {self.input_field.has_focus}")
             
     def hide(self) -> None:
         """Hide the search input."""
@@ -178,6 +183,49 @@ class SearchInput(Container):
 class SearchHighlighter:
     """Helper class to highlight search matches in text."""
     
+    @staticmethod
+    def _find_all_ci(text: str, query: str) -> List[Tuple[int, int]]:
+        """Find case-insensitive occurrences of query in text.
+        
+        This is the one matching rule for search: column search counts a row as a
+        match exactly when this finds something in it, so matching and highlighting
+        agree. Both sides are lower()ed once for a str.find scan; when lowering
+        changes a length (e.g. "İ"), offsets would no longer line up with text, so
+        the cached case-insensitive regex finds the spans instead.
+        
+        Args:
+            text: Text to search in
+            query: Non-empty search query
+            
+        Returns:
+            Non-overlapping (start, end) spans into text
+        """
+        lowered_text = text.lower()
+        lowered_query = query.lower()
+        if len(lowered_text) != len(text) or len(lowered_query) != len(query):
+            return [match.span() for match in _compile_query(query).finditer(text)]
+        size = len(lowered_query)
+        spans = []
+        start = lowered_text.find(lowered_query)
+        while start != -1:
+            spans.append((start, start + size))
+            start = lowered_text.find(lowered_query, start + size)
+        return spans
+    
+    @staticmethod
+    def matches(text: str, query: str) -> bool:
+        """Whether _find_all_ci(text, query) finds anything, without building spans.
+        
+        Args:
+            text: Text to search in
+            query: Non-empty search query
+        """
+        lowered_text = text.lower()
+        lowered_query = query.lower()
+        if len(lowered_text) != len(text) or len(lowered_query) != len(query):
+            return _compile_query(query).search(text) is not None
+        return lowered_query in lowered_text
+    
     @staticmethod
     def highlight(text: str, query: str, highlight_style: str = "bold yellow") -> str:
         """Highlight search query in text.
@@ -190,30 +238,20 @@ class SearchHighlighter:
         Returns:
             Text with Rich markup for highlighting
         """
-        if not query:
+        if not query or len(text) < len(query):
             return text
+        if text == query:
+            return f"[{highlight_style}]{text}[/{highlight_style}]"
             
-        # Case-insensitive search
-        import re
-        pattern = re.compile(re.escape(query), re.IGNORECASE)
-        
-        # Find all matches
-        matches = list(pattern.finditer(text))
-        if not matches:
-            return text
+        spans = SearchHighlighter._find_all_ci(text, query)
+        if not spans:
+            return text  # Common case: nothing to highlight, nothing allocated
             
-        # Build result with highlighting
         result = []
         last_end = 0
-        
-        for match in matches:
-            # Add text before match
-            result.append(text[last_end:match.start()])
-            # Add highlighted match
-            result.append(f"[{highlight_style}]{text[match.start():match.end()]}[/{highlight_style}]")
-            last_end = match.end()
-            
-        # Add remaining text
+        for start, end in spans:
+            result.append(text[last_end:start])
+            result.append(f"[{highlight_style}]{text[start:end]}[/{highlight_style}]")
+            last_end = end
         result.append(text[last_end:])
-        
-        return "".join(result)
\ No newline at end of file
+        return "".join(result)
@@ -4,13 +4,14 @@ Shows current context, quota usage, and keyboard hints.
 """
 # Created: 2025-08-03
 
-from typing import Optional
+from typing import Optional, Tuple
 
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.widgets import Static
 from textual.widget import Widget
-from textual.reactive import reactive
+from textual.timer import Timer
 
 
 class StatusBar(Widget):
@@ -58,16 +59,36 @@ class StatusBar(Widget):
     }
     """
     
-    # Reactive properties
-    context = reactive("")
-    status = reactive("")
-    quota = reactive("")
+    # Marked-items indicator shown before the context
+    _MRK_PREFIX = Text.from_markup("[yellow]Mrk[/yellow] ")
+    
+    # Default hints - corrected to match ranger behavior
+    _DEFAULT_HINTS = "q:quit /:search V:visual v:invert space:mark yy:copy dd:cut pp:paste"
+    
+    # right_widget class per quota usage bucket (none, >= 75% used, >= 90% used)
+    _QUOTA_CLASSES = ("", "quota-warning", "quota-critical")
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.left_widget: Optional[Static] = None
         self.center_widget: Optional[Static] = None
         self.right_widget: Optional[Static] = None
+        # Last values passed in. Plain attributes, not reactives: nothing watches them
+        # and the children are updated directly, so the descriptor work was pure cost
+        self.context = ""
+        self.status = ""
+        self.quota = ""
+        # Text currently shown in center_widget (status, hints or a message)
+        self._center_text: Optional[str] = None
+        # Pending show_message reset and the message it is waiting to clear
+        self._message_timer: Optional[Timer] = None
+        self._message_text: Optional[str] = None
+        # Last (context, marked_count) drawn on left_widget
+        self._last_context: Optional[Tuple[str, int]] = None
+        # Last quota string shown and the usage bucket (index into _QUOTA_CLASSES)
+        # whose class is on right_widget
+        self._last_quota = ""
+        self._quota_bucket = 0
         
     def compose(self) -> ComposeResult:
         """Create status bar layout."""
@@ -92,14 +113,18 @@ class StatusBar(Widget):
             marked_count: Number of marked items
         """
         self.context = context
-        display_text = context
+        if not self.left_widget or (context, marked_count) == self._last_context:
+            return
+        self._last_context = (context, marked_count)
         
-        # Add Mrk indicator if items are marked
+        # Plain Text, not markup: titles (and the "[cached]" suffix) can contain
+        # brackets, and the styled Mrk prefix is parsed once at class level
         if marked_count > 0:
-            display_text = f"[yellow]Mrk[/yellow] {marked_count} | {context}"
+            display_text = self._MRK_PREFIX + Text(f"{marked_count} | {context}")
+        else:
+            display_text = Text(context)
             
-        if self.left_widget:
-            self.left_widget.update(display_text)
+        self.left_widget.update(display_text)
             
     def update_status(self, status: str, quota: str = "") -> None:
         """Update status message and quota info.
@@ -112,32 +137,37 @@ class StatusBar(Widget):
         self.status = status
         self.quota = quota
 
-        if self.center_widget:
-            self.center_widget.update(status)
+        self._set_center(status)
 
-        if self.right_widget and quota:
+        # Quota only moves on API calls while status changes on most keys, so the
+        # parse, class swap and repaint below run only when the string differs
+        if self.right_widget and quota and quota != self._last_quota:
+            self._last_quota = quota
             display = f"Quota: {quota}"
-            # Parse "remaining/total" to add warning colours based on usage
-            if "/" in quota:
-                remaining, total = quota.split("/")
-                try:
-                    remaining_int = int(remaining)
-                    total_int = int(total)
-                    used_pct = ((total_int - remaining_int) / total_int) * 100 if total_int else 0
+            # Parse "remaining/total" to add warning colours based on usage. Validate
+            # up front instead of catching ValueError; remaining goes negative once
+            # the day's quota is overspent
+            remaining, sep, total = quota.partition("/")
+            if sep and remaining.removeprefix("-").isdecimal() and total.isdecimal():
+                remaining_int = int(remaining)
+                total_int = int(total)
+                # Usage bucket by integer cross-multiplication (no float divide):
+                # 2 at >= 90% used, 1 at >= 75%, else 0
+                used_x100 = (total_int - remaining_int) * 100
+                if total_int and used_x100 >= 90 * total_int:
+                    bucket = 2
+                elif total_int and used_x100 >= 75 * total_int:
+                    bucket = 1
+                else:
+                    bucket = 0
+                if bucket != self._quota_bucket:
+                    if self._quota_bucket:
+                        self.right_widget.remove_class(self._QUOTA_CLASSES[self._quota_bucket])
+                    if bucket:
+                        self.right_widget.add_class(self._QUOTA_CLASSES[bucket])
+                    self._quota_bucket = bucket
 
-                    if used_pct >= 90:
-                        self.right_widget.add_class("quota-critical")
-                        self.right_widget.remove_class("quota-warning")
-                    elif used_pct >= 75:
-                        self.right_widget.add_class("quota-warning")
-                        self.right_widget.remove_class("quota-critical")
-                    else:
-                        self.right_widget.remove_class("quota-warning")
-                        self.right_widget.remove_class("quota-critical")
-
-                    display = f"Quota left: {remaining_int:,}"
-                except ValueError:
-                    pass
+                display = f"Quota left: {remaining_int:,}"
 
             self.right_widget.update(display)
             
@@ -147,25 +177,29 @@ class StatusBar(Widget):
         Args:
             custom_hints: Custom hint text to display
         """
-        if custom_hints:
-            hints = custom_hints
-        else:
-            # Default hints - corrected to match ranger behavior
-            hints = "q:quit /:search V:visual v:invert space:mark yy:copy dd:cut pp:paste"
-        
-        if self.center_widget:
-            self.center_widget.update(hints)
+        self._set_center(custom_hints or self._DEFAULT_HINTS)
             
-    def show_message(self, message: str, duration: int = 3) -> None:
-        """Show a temporary message in the center."""
-        if self.center_widget:
-            original = self.center_widget.renderable
-            self.center_widget.update(message)
-            
-            # Reset after duration
-            from textual.timer import Timer
+    def _set_center(self, text: str) -> None:
+        """Show text in the center, skipping the repaint when it is already there."""
+        if self.center_widget and text != self._center_text:
+            self._center_text = text
+            self.center_widget.update(text)
             
-            def reset():
-                self.center_widget.update(original)
-                
-            self.set_timer(duration, reset)
\ No newline at end of file
+    def show_message(self, message: str, duration: int = 3) -> None:
+        """Show a temporary message in the center.
+        
+        A newer message replaces the pending reset of an older one, and the reset
+        only restores the hints if nothing else has been written since.
+        """
+        if self._message_timer is not None:
+            self._message_timer.stop()
+        self._message_text = message
+        self._set_center(message)
+        self._message_timer = self.set_timer(duration, self._reset_message)
+        
+    def _reset_message(self) -> None:
+        """Timer callback: put the hints back once a temporary message expires."""
+        self._message_timer = None
+        if self._center_text == self._message_text:
+            self.update_hints()
+        self._message_text = None
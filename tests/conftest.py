@@ -6,18 +6,35 @@ Provides common fixtures and test utilities.
 
 import pytest
 import sqlite3
-from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
-from unittest.mock import Mock, MagicMock
-
-# Import models from yanger package
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
 
+# Import models from yanger package (src/ is on sys.path via pytest's pythonpath setting)
 from yanger.models import Video, Playlist, PrivacyStatus
 from yanger.cache import PersistentCache
 from yanger.config.settings import Settings, TranscriptSettings
+from yanger.core.transcript_fetcher import TranscriptData, TranscriptFetcher, TranscriptSegment
+
+
+# sample_video timestamps (datetimes are immutable, so every Video can share them)
+_ADDED_AT = datetime(2024, 1, 15, 12, 0, 0)
+_PUBLISHED_AT = datetime(2009, 10, 24, 0, 0, 0)
+
+# Static transcript sample: (start, duration, text) rows, and the raw dicts and segments
+# built from them once at import (tests only read them; the raw-dict fixture hands out a
+# fresh list, and the frozen segments tuple is shared as is)
+_SAMPLE_ROWS = (
+    (0.0, 2.5, "Hello world"),
+    (2.5, 3.0, "This is a test transcript"),
+    (5.5, 2.0, "With multiple segments"),
+    (7.5, 1.5, "Thank you"),
+)
+_SAMPLE_RAW = tuple(
+    {"start": start, "duration": duration, "text": text}
+    for start, duration, text in _SAMPLE_ROWS
+)
+_SAMPLE_SEGMENTS = tuple(TranscriptSegment(*row) for row in _SAMPLE_ROWS)
 
 
 @pytest.fixture
@@ -28,16 +45,59 @@ def tmp_cache_dir(tmp_path):
     return cache_dir
 
 
+# Test databases are thrown away, so skip durability: no fsync, rollback journal in RAM
+FAST_TEST_PRAGMAS = {"synchronous": "OFF", "journal_mode": "MEMORY", "temp_store": "MEMORY"}
+
+
 @pytest.fixture
 def test_cache(tmp_cache_dir):
     """Provide a PersistentCache instance with temporary database."""
     cache = PersistentCache(
         cache_dir=tmp_cache_dir,
         ttl_days=7,
-        auto_cleanup=False
+        auto_cleanup=False,
+        pragmas=FAST_TEST_PRAGMAS
     )
     yield cache
-    # Cleanup is automatic when tmp_path is removed
+    cache.close()  # the database file itself goes with tmp_path
+
+
+# Transcript rows loaded once into shared_test_cache, in cache_transcripts_bulk order:
+# (video_id, transcript_text, transcript_json, language, auto_generated, fetch_status)
+SHARED_TRANSCRIPT_TEXTS = {
+    "exists_video": "\n".join(seg["text"] for seg in _SAMPLE_RAW),
+    "compress_test": "This is test transcript text for decompression.",
+}
+SHARED_TRANSCRIPT_ROWS = (
+    ("exists_video", TranscriptFetcher.compress_transcript(SHARED_TRANSCRIPT_TEXTS["exists_video"]),
+     '{"test": true}', "en", False, "SUCCESS"),
+    ("compress_test", TranscriptFetcher.compress_transcript(SHARED_TRANSCRIPT_TEXTS["compress_test"]),
+     None, "en", False, "SUCCESS"),
+    ("success_video", b"data", "{}", "en", False, "SUCCESS"),
+    ("no_transcript", None, None, None, False, "NOT_AVAILABLE"),
+    ("error_video", None, None, None, False, "ERROR"),
+    *(
+        (video_id, f"text_{video_id}".encode(), f'{{"id": "{video_id}"}}', "en", False, "SUCCESS")
+        for video_id in ("video_1", "video_2", "video_3")
+    ),
+)
+
+
+@pytest.fixture(scope="module")
+def shared_test_cache(tmp_path_factory):
+    """Provide one pre-populated PersistentCache per test module, for read-only tests.
+
+    Tests that write to the cache must use the function-scoped test_cache instead.
+    """
+    cache = PersistentCache(
+        cache_dir=tmp_path_factory.mktemp("cache"),
+        ttl_days=7,
+        auto_cleanup=False,
+        pragmas=FAST_TEST_PRAGMAS
+    )
+    cache.cache_transcripts_bulk(SHARED_TRANSCRIPT_ROWS)
+    yield cache
+    cache.close()
 
 
 @pytest.fixture
@@ -53,8 +113,8 @@ def sample_video():
         position=0,
         duration="PT3M33S",
         view_count=1234567890,
-        added_at=datetime(2024, 1, 15, 12, 0, 0),
-        published_at=datetime(2009, 10, 24, 0, 0, 0)
+        added_at=_ADDED_AT,
+        published_at=_PUBLISHED_AT
     )
 
 
@@ -75,52 +135,49 @@ def sample_playlist():
 @pytest.fixture
 def sample_transcript_segments():
     """Provide sample transcript segments."""
-    return [
-        {"start": 0.0, "duration": 2.5, "text": "Hello world"},
-        {"start": 2.5, "duration": 3.0, "text": "This is a test transcript"},
-        {"start": 5.5, "duration": 2.0, "text": "With multiple segments"},
-        {"start": 7.5, "duration": 1.5, "text": "Thank you"},
-    ]
+    return list(_SAMPLE_RAW)
 
 
-@pytest.fixture
-def sample_transcript_data(sample_transcript_segments):
-    """Provide sample TranscriptData object."""
-    from yanger.core.transcript_fetcher import TranscriptData, TranscriptSegment
-
-    segments = [
-        TranscriptSegment(
-            start=seg["start"],
-            duration=seg["duration"],
-            text=seg["text"]
-        )
-        for seg in sample_transcript_segments
-    ]
+@pytest.fixture(scope="session")
+def sample_transcript_data():
+    """Provide sample TranscriptData object, built once per session.
 
+    TranscriptData, its segments tuple and each segment are frozen, so sharing is safe.
+    """
     return TranscriptData(
         video_id="dQw4w9WgXcQ",
         language="en",
         auto_generated=False,
-        segments=segments,
+        segments=_SAMPLE_SEGMENTS,
         fetched_at="2024-01-15T12:00:00Z"
     )
 
 
+@pytest.fixture(scope="session")
+def sample_transcript_bundle(sample_transcript_data):
+    """Provide the sample transcript's text, gzip'd text and JSON, formatted once per session."""
+    text = TranscriptFetcher.format_as_text(sample_transcript_data)
+    return SimpleNamespace(
+        text=text,
+        compressed=TranscriptFetcher.compress_transcript(text),
+        json_data=TranscriptFetcher.format_as_json(sample_transcript_data),
+    )
+
+
 @pytest.fixture
 def mock_youtube_transcript_api():
-    """Provide a mock YouTubeTranscriptApi matching the 1.x interface.
+    """Provide a fake YouTubeTranscriptApi matching the 1.x interface.
 
-    Uses the real FetchedTranscript/snippet types so tests exercise the actual
-    1.x surface: api.list(...) -> TranscriptList, transcript.fetch() ->
-    FetchedTranscript of snippet objects with .start/.duration/.text attributes
-    (and a working .to_raw_data()).
+    Plain stubs from tests/fakes.py rather than MagicMocks, wrapped around the real
+    FetchedTranscript/snippet types so tests exercise the actual 1.x surface:
+    api.list(...) -> TranscriptList, transcript.fetch() -> FetchedTranscript of
+    snippet objects with .start/.duration/.text attributes (and a working .to_raw_data()).
     """
     from youtube_transcript_api._transcripts import (
         FetchedTranscript,
         FetchedTranscriptSnippet,
     )
-
-    mock_api = MagicMock()
+    from fakes import FakeTranscript, FakeTranscriptAPI, FakeTranscriptList
 
     # 1.x fetch() returns a FetchedTranscript of snippet objects (not dicts)
     fetched = FetchedTranscript(
@@ -134,21 +191,12 @@ def mock_youtube_transcript_api():
         is_generated=False,
     )
 
-    mock_transcript = MagicMock()
-    mock_transcript.language_code = "en"
-    mock_transcript.is_generated = False
-    mock_transcript.fetch.return_value = fetched
-
-    mock_transcript_list = MagicMock()
-    mock_transcript_list.find_transcript.return_value = mock_transcript
-    mock_api.list.return_value = mock_transcript_list
+    return FakeTranscriptAPI(FakeTranscriptList([FakeTranscript("en", fetched)]))
 
-    return mock_api
 
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_transcript_errors():
-    """Provide mock transcript error classes."""
+    """Provide mock transcript error classes (defined once per session)."""
     class TranscriptsDisabled(Exception):
         pass
 
@@ -188,9 +236,12 @@ def full_settings(transcript_settings):
     return settings
 
 
-def assert_db_table_exists(db_path: Path, table_name: str) -> bool:
+# The DB helpers below borrow the cache's own shared connection (PersistentCache._connect),
+# so assertions open nothing new and see exactly what the cache wrote.
+
+def assert_db_table_exists(cache: PersistentCache, table_name: str) -> bool:
     """Helper to check if a table exists in SQLite database."""
-    with sqlite3.connect(db_path) as conn:
+    with cache._connect() as conn:
         cursor = conn.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
             (table_name,)
@@ -198,25 +249,41 @@ def assert_db_table_exists(db_path: Path, table_name: str) -> bool:
         return cursor.fetchone() is not None
 
 
-def get_db_row_count(db_path: Path, table_name: str) -> int:
+def get_db_row_count(cache: PersistentCache, table_name: str) -> int:
     """Helper to get row count from a table."""
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.execute(f"SELECT COUNT(*) FROM {table_name}")
-        return cursor.fetchone()[0]
+    with cache._connect() as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
 
 
-def get_transcript_from_db(db_path: Path, video_id: str) -> Dict[str, Any]:
-    """Helper to get transcript data from database."""
-    with sqlite3.connect(db_path) as conn:
+def get_transcript_from_db(
+    cache: PersistentCache,
+    video_id: str,
+    columns: Tuple[str, ...] = ("*",),
+) -> Optional[sqlite3.Row]:
+    """Helper to get transcript data from database.
+
+    Args:
+        cache: Cache whose database to read
+        video_id: Video whose transcript row to fetch
+        columns: Columns to select; name only the ones a test checks to skip
+            reading the transcript blobs
+
+    Returns:
+        The row (indexable by column name), or None if there is none
+    """
+    with cache._connect() as conn:
         conn.row_factory = sqlite3.Row
+        if columns != ("*",):
+            # Column names are interpolated into the SQL, so only accept real ones
+            known = {info["name"] for info in conn.execute("PRAGMA table_info(video_transcripts)")}
+            unknown = set(columns) - known
+            if unknown:
+                raise ValueError(f"Unknown video_transcripts columns: {sorted(unknown)}")
         cursor = conn.execute(
-            "SELECT * FROM video_transcripts WHERE video_id = ?",
+            f"SELECT {', '.join(columns)} FROM video_transcripts WHERE video_id = ?",
             (video_id,)
         )
-        row = cursor.fetchone()
-        if row:
-            return dict(row)
-        return None
+        return cursor.fetchone()
 
 
 @pytest.fixture
@@ -132,3 +132,54 @@ class FakeYouTubeAPIClient:
 
     def get_videos_by_ids(self, video_ids: List[str]) -> List[Dict[str, Any]]:
         return [{"video_id": vid, "title": f"Video {vid}"} for vid in video_ids]
+
+
+class FakeTranscript:
+    """youtube_transcript_api 1.x ``Transcript`` double: language info plus ``fetch()``."""
+
+    def __init__(self, language_code: str, fetched, is_generated: bool = False):
+        self.language_code = language_code
+        self.is_generated = is_generated
+        self._fetched = fetched
+
+    def fetch(self):
+        return self._fetched
+
+
+class FakeTranscriptList:
+    """1.x ``TranscriptList`` double: finders raise ``not_found`` like the real list."""
+
+    def __init__(self, transcripts: List[FakeTranscript], not_found=LookupError):
+        self._transcripts = transcripts
+        self._not_found = not_found
+
+    def __iter__(self):
+        return iter(self._transcripts)
+
+    def find_transcript(self, language_codes: List[str]) -> FakeTranscript:
+        return self._find(language_codes, generated=None)
+
+    def find_generated_transcript(self, language_codes: List[str]) -> FakeTranscript:
+        return self._find(language_codes, generated=True)
+
+    def _find(self, language_codes: List[str], generated: Optional[bool]) -> FakeTranscript:
+        for code in language_codes:
+            for t in self._transcripts:
+                if t.language_code == code and generated in (None, t.is_generated):
+                    return t
+        raise self._not_found(language_codes)
+
+
+class FakeTranscriptAPI:
+    """1.x ``YouTubeTranscriptApi`` instance double: ``list()`` returns ``transcript_list``
+    or raises ``error``."""
+
+    def __init__(self, transcript_list: Optional[FakeTranscriptList] = None,
+                 error: Optional[Exception] = None):
+        self._transcript_list = transcript_list or FakeTranscriptList([])
+        self._error = error
+
+    def list(self, video_id: str) -> FakeTranscriptList:
+        if self._error is not None:
+            raise self._error
+        return self._transcript_list
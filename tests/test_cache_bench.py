@@ -0,0 +1,33 @@
+"""Throughput guard for batched transcript inserts (opt-in: ``pytest -m perf``).
+
+Fails if writing a playlist's worth of transcripts through cache_transcripts_bulk stops
+being one batched transaction -- e.g. if it regresses to a commit per row.
+"""
+
+import pytest
+
+from yanger.cache import PersistentCache
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.perf
+
+_ROWS = [
+    (f"video_{i}", b"x" * 512, '{"segments": []}', "en", False, "SUCCESS")
+    for i in range(1000)
+]
+
+
+@pytest.fixture
+def durable_cache(tmp_path):
+    """A cache with the production PRAGMAs (WAL, default synchronous), unlike test_cache,
+    so every commit pays the fsync that batching is meant to amortise."""
+    cache = PersistentCache(cache_dir=tmp_path, auto_cleanup=False)
+    yield cache
+    cache.close()
+
+
+def test_bulk_insert_speed(benchmark, durable_cache):
+    benchmark(durable_cache.cache_transcripts_bulk, _ROWS)
+    assert benchmark.stats["mean"] < 0.1
+    assert durable_cache.get_transcript_status("video_999") == "SUCCESS"
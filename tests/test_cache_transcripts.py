@@ -9,28 +9,36 @@ Tests PersistentCache transcript methods including:
 """
 # Created: 2025-11-07
 
+import filecmp
 import pytest
-import sqlite3
 import json
 from pathlib import Path
 from datetime import datetime
 
+from yanger.cache import _TRANSCRIPT_STATUS_SQL
 from yanger.core.transcript_fetcher import TranscriptFetcher
 from yanger.models import Playlist, PrivacyStatus, Video
-from conftest import assert_db_table_exists, get_db_row_count, get_transcript_from_db
+from conftest import (
+    SHARED_TRANSCRIPT_ROWS,
+    SHARED_TRANSCRIPT_TEXTS,
+    assert_db_table_exists,
+    get_db_row_count,
+    get_transcript_from_db,
+)
+
+SHARED_ROWS = {row[0]: row for row in SHARED_TRANSCRIPT_ROWS}
 
 
 class TestTranscriptDatabaseSchema:
     """Test database schema for transcripts."""
 
-    def test_video_transcripts_table_created(self, test_cache):
+    def test_video_transcripts_table_created(self, shared_test_cache):
         """Test that video_transcripts table is created."""
-        db_path = test_cache.db_path
-        assert assert_db_table_exists(db_path, "video_transcripts")
+        assert assert_db_table_exists(shared_test_cache, "video_transcripts")
 
-    def test_video_transcripts_schema(self, test_cache):
+    def test_video_transcripts_schema(self, shared_test_cache):
         """Test video_transcripts table has correct columns."""
-        with sqlite3.connect(test_cache.db_path) as conn:
+        with shared_test_cache._connect() as conn:
             cursor = conn.execute("PRAGMA table_info(video_transcripts)")
             columns = {row[1]: row[2] for row in cursor.fetchall()}
 
@@ -49,24 +57,37 @@ class TestTranscriptDatabaseSchema:
             schema = cursor.fetchone()[0]
             assert 'PRIMARY KEY' in schema
 
-    def test_transcript_index_created(self, test_cache):
+    def test_transcript_index_created(self, shared_test_cache):
         """Test that transcript index is created."""
-        with sqlite3.connect(test_cache.db_path) as conn:
+        with shared_test_cache._connect() as conn:
             cursor = conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_transcripts_video'"
             )
             assert cursor.fetchone() is not None
 
+    def test_status_lookup_uses_covering_index(self, shared_test_cache):
+        """get_transcript_status's query is answered from idx_transcripts_status_cover."""
+        with shared_test_cache._connect() as conn:
+            cursor = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_transcripts_status_cover'"
+            )
+            assert cursor.fetchone() is not None
+            plan = " ".join(
+                row[-1] for row in conn.execute(
+                    "EXPLAIN QUERY PLAN " + _TRANSCRIPT_STATUS_SQL, ("success_video",)
+                )
+            )
+        assert "USING COVERING INDEX idx_transcripts_status_cover" in plan
+
 
 class TestCacheTranscript:
     """Test cache_transcript method."""
 
-    def test_cache_transcript_with_compressed_data(self, test_cache, sample_transcript_data):
+    def test_cache_transcript_with_compressed_data(self, test_cache, sample_transcript_bundle):
         """Test caching transcript with compressed text."""
         video_id = "test_video_123"
-        text = TranscriptFetcher.format_as_text(sample_transcript_data)
-        compressed = TranscriptFetcher.compress_transcript(text)
-        json_data = TranscriptFetcher.format_as_json(sample_transcript_data)
+        compressed = sample_transcript_bundle.compressed
+        json_data = sample_transcript_bundle.json_data
 
         test_cache.cache_transcript(
             video_id=video_id,
@@ -78,7 +99,7 @@ class TestCacheTranscript:
         )
 
         # Verify in database
-        row = get_transcript_from_db(test_cache.db_path, video_id)
+        row = get_transcript_from_db(test_cache, video_id)
         assert row is not None
         assert row['video_id'] == video_id
         assert row['language'] == "en"
@@ -100,7 +121,7 @@ class TestCacheTranscript:
             fetch_status="NOT_AVAILABLE"
         )
 
-        row = get_transcript_from_db(test_cache.db_path, video_id)
+        row = get_transcript_from_db(test_cache, video_id)
         assert row is not None
         assert row['fetch_status'] == "NOT_AVAILABLE"
         assert row['transcript_text'] is None
@@ -131,11 +152,13 @@ class TestCacheTranscript:
         )
 
         # Should only have one row
-        count = get_db_row_count(test_cache.db_path, "video_transcripts")
+        count = get_db_row_count(test_cache, "video_transcripts")
         assert count == 1
 
         # Should have latest data
-        row = get_transcript_from_db(test_cache.db_path, video_id)
+        row = get_transcript_from_db(
+            test_cache, video_id, ("language", "auto_generated", "transcript_json")
+        )
         assert row['language'] == "es"
         assert row['auto_generated'] == 1
         assert row['transcript_json'] == '{"version": 2}'
@@ -151,7 +174,7 @@ class TestCacheTranscript:
             fetch_status="SUCCESS"
         )
 
-        row = get_transcript_from_db(test_cache.db_path, "auto_gen")
+        row = get_transcript_from_db(test_cache, "auto_gen", ("auto_generated",))
         assert row['auto_generated'] == 1  # True stored as 1
 
         test_cache.cache_transcript(
@@ -163,127 +186,90 @@ class TestCacheTranscript:
             fetch_status="SUCCESS"
         )
 
-        row = get_transcript_from_db(test_cache.db_path, "manual")
+        row = get_transcript_from_db(test_cache, "manual", ("auto_generated",))
         assert row['auto_generated'] == 0  # False stored as 0
 
+    def test_db_helper_rejects_unknown_columns(self, test_cache):
+        """get_transcript_from_db interpolates column names, so it must refuse unknown ones."""
+        test_cache.cache_transcript(
+            video_id="v",
+            transcript_text=None,
+            transcript_json=None,
+            language=None,
+            auto_generated=False,
+            fetch_status="NOT_AVAILABLE"
+        )
+        row = get_transcript_from_db(test_cache, "v", ("fetch_status",))
+        assert row[0] == "NOT_AVAILABLE"
+        with pytest.raises(ValueError):
+            get_transcript_from_db(test_cache, "v", ("1; DROP TABLE video_transcripts",))
+
 
 class TestGetTranscript:
     """Test get_transcript method."""
 
-    def test_get_transcript_exists(self, test_cache, sample_transcript_data):
+    def test_get_transcript_exists(self, shared_test_cache):
         """Test retrieving existing transcript."""
         video_id = "exists_video"
-        text = TranscriptFetcher.format_as_text(sample_transcript_data)
-        compressed = TranscriptFetcher.compress_transcript(text)
-
-        test_cache.cache_transcript(
-            video_id=video_id,
-            transcript_text=compressed,
-            transcript_json='{"test": true}',
-            language="en",
-            auto_generated=False,
-            fetch_status="SUCCESS"
-        )
-
-        result = test_cache.get_transcript(video_id)
+        result = shared_test_cache.get_transcript(video_id)
 
         assert result is not None
         assert result['video_id'] == video_id
         assert result['language'] == "en"
         assert result['auto_generated'] is False  # Converted to bool
         assert result['fetch_status'] == "SUCCESS"
-        assert result['transcript_text'] == compressed
+        assert result['transcript_text'] == SHARED_ROWS[video_id][1]
         assert result['transcript_json'] == '{"test": true}'
 
-    def test_get_transcript_not_exists(self, test_cache):
+    def test_get_transcript_not_exists(self, shared_test_cache):
         """Test retrieving non-existent transcript returns None."""
-        result = test_cache.get_transcript("nonexistent_video")
+        result = shared_test_cache.get_transcript("nonexistent_video")
         assert result is None
 
-    def test_get_transcript_decompression_works(self, test_cache):
+    def test_get_transcript_decompression_works(self, shared_test_cache):
         """Test that retrieved compressed text can be decompressed."""
-        video_id = "compress_test"
-        original_text = "This is test transcript text for decompression."
-        compressed = TranscriptFetcher.compress_transcript(original_text)
-
-        test_cache.cache_transcript(
-            video_id=video_id,
-            transcript_text=compressed,
-            transcript_json=None,
-            language="en",
-            auto_generated=False,
-            fetch_status="SUCCESS"
-        )
-
-        result = test_cache.get_transcript(video_id)
+        result = shared_test_cache.get_transcript("compress_test")
         decompressed = TranscriptFetcher.decompress_transcript(result['transcript_text'])
 
-        assert decompressed == original_text
+        assert decompressed == SHARED_TRANSCRIPT_TEXTS["compress_test"]
 
 
 class TestGetTranscriptStatus:
     """Test get_transcript_status method."""
 
-    def test_get_status_success(self, test_cache):
+    def test_get_status_success(self, shared_test_cache):
         """Test getting status of successful transcript."""
-        test_cache.cache_transcript(
-            video_id="success_video",
-            transcript_text=b"data",
-            transcript_json="{}",
-            language="en",
-            auto_generated=False,
-            fetch_status="SUCCESS"
-        )
-
-        status = test_cache.get_transcript_status("success_video")
+        status = shared_test_cache.get_transcript_status("success_video")
         assert status == "SUCCESS"
 
-    def test_get_status_not_available(self, test_cache):
+    def test_get_status_not_available(self, shared_test_cache):
         """Test getting status when transcript not available."""
-        test_cache.cache_transcript(
-            video_id="no_transcript",
-            transcript_text=None,
-            transcript_json=None,
-            language=None,
-            auto_generated=False,
-            fetch_status="NOT_AVAILABLE"
-        )
-
-        status = test_cache.get_transcript_status("no_transcript")
+        status = shared_test_cache.get_transcript_status("no_transcript")
         assert status == "NOT_AVAILABLE"
 
-    def test_get_status_error(self, test_cache):
+    def test_get_status_error(self, shared_test_cache):
         """Test getting status when fetch had error."""
-        test_cache.cache_transcript(
-            video_id="error_video",
-            transcript_text=None,
-            transcript_json=None,
-            language=None,
-            auto_generated=False,
-            fetch_status="ERROR"
-        )
-
-        status = test_cache.get_transcript_status("error_video")
+        status = shared_test_cache.get_transcript_status("error_video")
         assert status == "ERROR"
 
-    def test_get_status_not_cached(self, test_cache):
+    def test_get_status_not_cached(self, shared_test_cache):
         """Test getting status for video not in cache."""
-        status = test_cache.get_transcript_status("never_cached")
+        status = shared_test_cache.get_transcript_status("never_cached")
         assert status is None
 
 
 class TestExportTranscript:
     """Test export_transcript method."""
 
-    def test_export_transcript_success(self, test_cache, tmp_path, sample_transcript_data):
+    def test_export_transcript_success(self, test_cache, tmp_path, sample_transcript_bundle):
         """Test successful transcript export to files."""
         video_id = "export_test"
         export_dir = tmp_path / "exports"
 
         # Cache transcript
-        text = TranscriptFetcher.format_as_text(sample_transcript_data)
-        compressed = TranscriptFetcher.compress_transcript(text)
-        json_data = TranscriptFetcher.format_as_json(sample_transcript_data)
+        text = sample_transcript_bundle.text
+        compressed = sample_transcript_bundle.compressed
+        json_data = sample_transcript_bundle.json_data
 
         test_cache.cache_transcript(
             video_id=video_id,
@@ -301,15 +287,21 @@ class TestExportTranscript:
         assert error is None
         assert export_dir.exists()
 
+        # Compare block-wise against reference files rather than reading exports back
+        expected_txt = tmp_path / "expected.txt"
+        expected_txt.write_text(text, encoding="utf-8")
+        expected_json = tmp_path / "expected.json"
+        expected_json.write_text(json_data, encoding="utf-8")
+
         # Check txt file
         txt_file = export_dir / f"{video_id}.txt"
         assert txt_file.exists()
-        assert txt_file.read_text() == text
+        assert filecmp.cmp(txt_file, expected_txt, shallow=False)
 
         # Check json file
         json_file = export_dir / f"{video_id}.json"
         assert json_file.exists()
-        assert json_file.read_text() == json_data
+        assert filecmp.cmp(json_file, expected_json, shallow=False)
 
     def test_export_transcript_not_found(self, test_cache, tmp_path):
         """Test export fails when transcript not in cache."""
@@ -339,15 +331,14 @@ class TestExportTranscript:
         assert success is False
         assert error == "Transcript not available"
 
-    def test_export_creates_directory(self, test_cache, tmp_path, sample_transcript_data):
+    def test_export_creates_directory(self, test_cache, tmp_path, sample_transcript_bundle):
         """Test export creates directory if it doesn't exist."""
         video_id = "create_dir_test"
         export_dir = tmp_path / "deeply" / "nested" / "path"
 
         assert not export_dir.exists()
 
-        text = TranscriptFetcher.format_as_text(sample_transcript_data)
-        compressed = TranscriptFetcher.compress_transcript(text)
+        compressed = sample_transcript_bundle.compressed
 
         test_cache.cache_transcript(
             video_id=video_id,
@@ -363,6 +354,24 @@ class TestExportTranscript:
         assert success is True
         assert export_dir.exists()
 
+    def test_export_reports_corrupt_transcript_blob(self, test_cache, tmp_path):
+        """A stored blob that isn't gzip fails the export instead of raising."""
+        test_cache.cache_transcript(
+            video_id="corrupt",
+            transcript_text=b"not gzip",
+            transcript_json=None,
+            language="en",
+            auto_generated=False,
+            fetch_status="SUCCESS"
+        )
+
+        export_dir = tmp_path / "exports"
+        success, error = test_cache.export_transcript("corrupt", export_dir)
+
+        assert success is False
+        assert error
+        assert list(export_dir.iterdir()) == []  # no truncated .txt or temp file left
+
 
 class TestClearTranscriptCache:
     """Test clear_transcript_cache method."""
@@ -374,25 +383,18 @@ class TestClearTranscriptCache:
 
     def test_clear_cache_with_transcripts(self, test_cache):
         """Test clearing cache removes all transcripts."""
-        # Add multiple transcripts
-        for i in range(5):
-            test_cache.cache_transcript(
-                video_id=f"video_{i}",
-                transcript_text=b"test",
-                transcript_json="{}",
-                language="en",
-                auto_generated=False,
-                fetch_status="SUCCESS"
-            )
+        # Add multiple transcripts in one transaction
+        rows = [(f"video_{i}", b"test", "{}", "en", False, "SUCCESS") for i in range(5)]
+        assert test_cache.cache_transcripts_bulk(rows) == 5
 
         # Verify they exist
-        assert get_db_row_count(test_cache.db_path, "video_transcripts") == 5
+        assert get_db_row_count(test_cache, "video_transcripts") == 5
 
         # Clear
         count = test_cache.clear_transcript_cache()
 
         assert count == 5
-        assert get_db_row_count(test_cache.db_path, "video_transcripts") == 0
+        assert get_db_row_count(test_cache, "video_transcripts") == 0
 
     def test_clear_cache_idempotent(self, test_cache):
         """Test clearing cache multiple times is safe."""
@@ -433,11 +435,11 @@ class TestForeignKeysEnabled:
         pid = test_cache.import_virtual_playlist(
             "VP", [{"video_id": "a"}, {"video_id": "b"}]
         )
-        assert get_db_row_count(test_cache.db_path, "virtual_videos") == 2
+        assert get_db_row_count(test_cache, "virtual_videos") == 2
 
         test_cache.delete_virtual_playlist(pid)
         # Cascade only fires when foreign_keys is ON for this connection too.
-        assert get_db_row_count(test_cache.db_path, "virtual_videos") == 0
+        assert get_db_row_count(test_cache, "virtual_videos") == 0
 
 
 class TestGetVideosEmptyCache:
@@ -483,14 +485,13 @@ class TestGetVideosEmptyCache:
 class TestTranscriptCacheIntegration:
     """Integration tests for transcript caching workflow."""
 
-    def test_full_workflow(self, test_cache, tmp_path, sample_transcript_data):
+    def test_full_workflow(self, test_cache, tmp_path, sample_transcript_bundle):
         """Test complete workflow: cache, retrieve, export, clear."""
         video_id = "workflow_test"
 
         # 1. Cache transcript
-        text = TranscriptFetcher.format_as_text(sample_transcript_data)
-        compressed = TranscriptFetcher.compress_transcript(text)
-        json_data = TranscriptFetcher.format_as_json(sample_transcript_data)
+        compressed = sample_transcript_bundle.compressed
+        json_data = sample_transcript_bundle.json_data
 
         test_cache.cache_transcript(
             video_id=video_id,
@@ -521,32 +522,14 @@ class TestTranscriptCacheIntegration:
         assert count == 1
         assert test_cache.get_transcript_status(video_id) is None
 
-    def test_multiple_videos_independent(self, test_cache):
+    @pytest.mark.parametrize("video_id", ["video_1", "video_2", "video_3"])
+    def test_multiple_videos_independent(self, shared_test_cache, video_id):
         """Test that multiple videos can be cached independently."""
-        videos = ["video_1", "video_2", "video_3"]
-
-        for video_id in videos:
-            test_cache.cache_transcript(
-                video_id=video_id,
-                transcript_text=f"text_{video_id}".encode(),
-                transcript_json=f'{{"id": "{video_id}"}}',
-                language="en",
-                auto_generated=False,
-                fetch_status="SUCCESS"
-            )
-
-        # Verify all are cached independently
-        for video_id in videos:
-            cached = test_cache.get_transcript(video_id)
-            assert cached is not None
-            assert cached['video_id'] == video_id
-            assert cached['transcript_text'] == f"text_{video_id}".encode()
-
-        # Clear one shouldn't affect others
-        # (Note: current clear_transcript_cache clears all, but this tests independence of get)
-        assert test_cache.get_transcript("video_1") is not None
-        assert test_cache.get_transcript("video_2") is not None
-        assert test_cache.get_transcript("video_3") is not None
+        cached = shared_test_cache.get_transcript(video_id)
+        assert cached is not None
+        assert cached['video_id'] == video_id
+        assert cached['transcript_text'] == f"text_{video_id}".encode()
+        assert cached['transcript_json'] == f'{{"id": "{video_id}"}}'
 
 
 class TestSetVideosForeignKey:
@@ -5,8 +5,11 @@ never exist for a real install, so it silently no-op'd. These tests pin it to th
 resolvers by sandboxing $HOME, and confirm the destructive actions are guarded.
 """
 
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
 from yanger.cli import cli
@@ -104,10 +107,74 @@ def test_verbose_flag_accepted(monkeypatch, tmp_path):
 
 def test_connect_sets_wal_and_busy_timeout(tmp_path):
     cache = PersistentCache(cache_dir=tmp_path / "c", auto_cleanup=False)
-    conn = cache._connect()
-    try:
+    with cache._connect() as conn:
         assert conn.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal"
         assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
         assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
-    finally:
-        conn.close()
+
+
+def test_connect_applies_pragma_overrides(tmp_path):
+    cache = PersistentCache(
+        cache_dir=tmp_path / "c", auto_cleanup=False,
+        pragmas={"synchronous": "OFF", "journal_mode": "MEMORY"},
+    )
+    with cache._connect() as conn:
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0].lower() == "memory"
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+
+@pytest.mark.parametrize("pragmas", [{"synchronous; DROP": "OFF"}, {"synchronous": "OFF; DROP"}])
+def test_rejects_malformed_pragmas(tmp_path, pragmas):
+    with pytest.raises(ValueError):
+        PersistentCache(cache_dir=tmp_path / "c", auto_cleanup=False, pragmas=pragmas)
+
+
+def test_connect_reuses_one_connection_and_resets_row_factory(tmp_path):
+    cache = PersistentCache(cache_dir=tmp_path / "c", auto_cleanup=False)
+    with cache._connect() as first:
+        first.row_factory = sqlite3.Row
+    with cache._connect() as second:
+        assert second is first
+        assert second.row_factory is None
+    cache.close()
+    with cache._connect() as reopened:
+        assert reopened is not first
+        assert reopened.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    cache.close()
+
+
+def test_shared_connection_is_usable_from_worker_threads(tmp_path):
+    cache = PersistentCache(cache_dir=tmp_path / "c", auto_cleanup=False)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: cache.add_quota_used(1, "2025-01-01"), range(20)))
+    assert cache.get_quota_used("2025-01-01") == 20
+    cache.close()
+
+
+def test_cli_command_closes_its_cache(monkeypatch, tmp_path):
+    _sandbox_home(monkeypatch, tmp_path)
+    closed = []
+    real_close = PersistentCache.close
+
+    def _close(self):
+        closed.append(self.db_path)
+        real_close(self)
+
+    monkeypatch.setattr(PersistentCache, "close", _close)
+    result = CliRunner().invoke(cli, ["dedupe-virtual", "--dry-run"])
+    assert result.exit_code == 0, result.output
+    assert closed == [default_cache_dir() / "cache.db"]
+
+
+def test_close_checkpoints_and_truncates_the_wal(tmp_path):
+    cache = PersistentCache(
+        cache_dir=tmp_path / "c", auto_cleanup=False, pragmas={"wal_autocheckpoint": 0}
+    )
+    cache.cache_transcripts_bulk([(f"v{i}", b"x" * 1000, None, "en", False, "SUCCESS") for i in range(20)])
+    wal = cache.db_path.with_name(cache.db_path.name + "-wal")
+    assert wal.stat().st_size > 0
+    cache.close()
+    assert not wal.exists() or wal.stat().st_size == 0
+    assert cache.get_transcript_status("v19") == "SUCCESS"
+    cache.close()
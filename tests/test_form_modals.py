@@ -0,0 +1,68 @@
+"""PlaylistCreationModal / RenameModal submit paths, driven through a headless app."""
+
+from textual.app import App
+
+from yanger.ui.playlist_creation_modal import PlaylistCreated, PlaylistCreationModal
+from yanger.ui.rename_modal import ItemRenamed, RenameModal
+
+
+class _ModalApp(App):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def on_playlist_created(self, message):
+        self.messages.append(message)
+
+    def on_item_renamed(self, message):
+        self.messages.append(message)
+
+
+async def test_create_playlist_posts_trimmed_fields():
+    app = _ModalApp()
+    async with app.run_test() as pilot:
+        modal = PlaylistCreationModal()
+        await app.push_screen(modal)
+        await pilot.pause()
+        assert modal._title_input.has_focus
+        modal._title_input.value = "  Mix  "
+        modal._description_input.value = "songs"
+        modal.query_one("#public").value = True
+        await pilot.pause()  # RadioSet tracks the pressed button via a message
+        modal.create_playlist()
+        await pilot.pause()
+    [created] = app.messages
+    assert isinstance(created, PlaylistCreated)
+    assert (created.title, created.description, created.privacy) == ("Mix", "songs", "public")
+
+
+async def test_create_playlist_requires_a_title():
+    app = _ModalApp()
+    async with app.run_test() as pilot:
+        modal = PlaylistCreationModal()
+        await app.push_screen(modal)
+        modal._title_input.value = "   "
+        modal.create_playlist()
+        await pilot.pause()
+        assert app.screen is modal
+    assert app.messages == []
+
+
+async def test_rename_posts_only_when_name_changes():
+    app = _ModalApp()
+    async with app.run_test() as pilot:
+        modal = RenameModal("video", "v1", "Old")
+        await app.push_screen(modal)
+        modal._name_input.value = "Old "
+        modal.rename_item()
+        await pilot.pause()
+        assert app.messages == []
+
+        modal = RenameModal("video", "v1", "Old")
+        await app.push_screen(modal)
+        modal._name_input.value = "New"
+        modal.rename_item()
+        await pilot.pause()
+    [renamed] = app.messages
+    assert isinstance(renamed, ItemRenamed)
+    assert (renamed.item_id, renamed.old_name, renamed.new_name) == ("v1", "Old", "New")
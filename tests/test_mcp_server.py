@@ -13,9 +13,6 @@ from datetime import datetime
 from unittest.mock import Mock, MagicMock, patch, AsyncMock
 import shutil
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from yanger.models import Video, Playlist, PrivacyStatus
 from yanger.core.transcript_fetcher import TranscriptData, TranscriptSegment
 
@@ -131,10 +128,10 @@ def mock_transcript_fetcher():
     """Create a mock transcript fetcher."""
     fetcher = MagicMock()
 
-    segments = [
+    segments = (
         TranscriptSegment(start=0.0, duration=2.5, text="Hello world"),
         TranscriptSegment(start=2.5, duration=3.0, text="This is a test"),
-    ]
+    )
 
     transcript = TranscriptData(
         video_id="video1",
@@ -0,0 +1,198 @@
+"""MillerView.handle_key dispatch: navigation, marking and search keys.
+
+Drives handle_key directly on a MillerView mounted in a minimal headless app and records
+the messages it posts, so the key table can be checked without the full YouTubeRangerApp.
+"""
+
+import pytest
+import pytest_asyncio
+
+from textual.app import App, ComposeResult
+
+from yanger.app import MILLER_VIEW_KEYS
+from yanger.models import Playlist, Video
+from yanger.ui.miller_view import (
+    MarksChanged,
+    MillerView,
+    PlaylistSelected,
+    RangerCommand,
+    SearchStatusUpdate,
+    SortMenuRequest,
+    VideoSelected,
+)
+
+
+class _MillerApp(App):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def compose(self) -> ComposeResult:
+        yield MillerView(id="miller-view")
+
+    def on_playlist_selected(self, message):
+        self.messages.append(message)
+
+    def on_video_selected(self, message):
+        self.messages.append(message)
+
+    def on_ranger_command(self, message):
+        self.messages.append(message)
+
+    def on_marks_changed(self, message):
+        self.messages.append(message)
+
+    def on_search_status_update(self, message):
+        self.messages.append(message)
+
+    def on_sort_menu_request(self, message):
+        self.messages.append(message)
+
+
+@pytest_asyncio.fixture
+async def view_pilot():
+    app = _MillerApp()
+    async with app.run_test() as pilot:
+        view = app.query_one(MillerView)
+        await view.set_playlists([
+            Playlist(id=f"p{i}", title=f"Playlist {i}", item_count=i) for i in range(3)
+        ])
+        await view.set_videos([
+            Video(id=f"v{i}", playlist_item_id=f"pi{i}", title=f"Video {i}", channel_title="C")
+            for i in range(5)
+        ])
+        await pilot.pause()
+        app.messages.clear()
+        yield app, view, pilot
+        await pilot.pause()
+
+
+def test_every_forwarded_key_has_a_handler():
+    assert set(MillerView._KEY_TABLE) >= MILLER_VIEW_KEYS
+
+
+async def _press(view, pilot, *keys):
+    for key in keys:
+        await view.handle_key(key)
+    await pilot.pause()
+
+
+async def test_column_focus_moves_with_h_and_l(view_pilot):
+    app, view, pilot = view_pilot
+    await _press(view, pilot, "l", "right", "l")
+    assert view.focused_column == 2
+    await _press(view, pilot, "h", "left", "h")
+    assert view.focused_column == 0
+
+
+async def test_vertical_navigation_in_both_columns(view_pilot):
+    app, view, pilot = view_pilot
+    await _press(view, pilot, "j", "down")
+    assert view.playlist_column.selected_index == 2
+    await _press(view, pilot, "k")
+    assert view.playlist_column.selected_index == 1
+
+    await _press(view, pilot, "l", "G")
+    assert view.video_column.selected_index == 4
+    await _press(view, pilot, "g", "j", "j", "up")
+    assert view.video_column.selected_index == 1
+
+
+async def test_enter_selects_current_item(view_pilot):
+    app, view, pilot = view_pilot
+    await _press(view, pilot, "j", "enter")
+    assert any(isinstance(m, PlaylistSelected) and m.playlist.id == "p1" for m in app.messages)
+    app.messages.clear()
+    await _press(view, pilot, "l", "j", "enter")
+    assert any(isinstance(m, VideoSelected) and m.video.id == "v1" for m in app.messages)
+
+
+async def test_space_marks_and_reports_count(view_pilot):
+    app, view, pilot = view_pilot
+    await _press(view, pilot, "l", "space")
+    assert [m.count for m in app.messages if isinstance(m, MarksChanged)] == [1]
+
+
+@pytest.mark.parametrize("key,expected", [
+    ("d", RangerCommand), ("y", RangerCommand), ("p", RangerCommand), ("o", SortMenuRequest),
+])
+async def test_ranger_keys_post_only_from_video_column(view_pilot, key, expected):
+    app, view, pilot = view_pilot
+    await _press(view, pilot, key)
+    assert not any(isinstance(m, expected) for m in app.messages)
+    await _press(view, pilot, "l", key)
+    assert any(isinstance(m, expected) for m in app.messages)
+
+
+async def test_search_next_and_previous_report_status(view_pilot):
+    app, view, pilot = view_pilot
+    view.focused_column = 1
+    view.video_column.videos[1].title = "needle"
+    view.video_column.videos[3].title = "needle"
+    view.on_search_submit("needle")
+    await _press(view, pilot, "n", "n", "N")
+    statuses = [(m.current, m.total) for m in app.messages if isinstance(m, SearchStatusUpdate)]
+    assert statuses == [(1, 2), (2, 2), (1, 2), (2, 2)]
+    assert view.video_column.selected_index == 3
+
+    await _press(view, pilot, "escape")
+    assert view.search_active is False
+    assert view.video_column.search_matches == []
+
+
+async def test_visual_mode_marks_range(view_pilot):
+    app, view, pilot = view_pilot
+    await _press(view, pilot, "l", "V", "j", "j", "V")
+    assert [v.id for v in view.video_column.get_marked_videos()] == ["v0", "v1", "v2"]
+    await _press(view, pilot, "u", "v")
+    assert view.video_column.get_marked_count() == 0
+
+
+async def test_visual_mode_key_repeat_coalesces_repaints(view_pilot, monkeypatch):
+    app, view, pilot = view_pilot
+    await _press(view, pilot, "l", "V")
+    repaints = []
+    monkeypatch.setattr(view.video_column, "repaint_page", lambda: repaints.append(1))
+    for _ in range(3):
+        await view.handle_key("j")
+    await pilot.pause()
+    assert repaints == [1]
+    assert view.video_column.render_row(3)[0].startswith("◆ ")
+
+
+async def test_playlist_search_steps_from_the_cursor(view_pilot):
+    app, view, pilot = view_pilot
+    column = view.playlist_column
+    column.playlists[0].title = "needle"
+    column.playlists[2].title = "needle"
+    view.on_search_submit("needle")
+    assert column.search_matches == [0, 2]
+    column.selected_index = 1
+    await _press(view, pilot, "n")
+    assert column.selected_index == 2
+    column.selected_index = 1
+    await _press(view, pilot, "N")
+    assert column.selected_index == 0
+    await _press(view, pilot, "N")
+    assert column.selected_index == 2  # wraps
+
+
+async def test_escape_leaves_visual_mode_before_cancelling_search(view_pilot):
+    app, view, pilot = view_pilot
+    view.focused_column = 1
+    view.on_search_submit("Video")
+    await _press(view, pilot, "V", "j", "escape")
+    assert view.video_column.visual_mode is False
+    assert view.video_column.get_marked_count() == 0
+    assert view.search_active is True
+    await _press(view, pilot, "escape")
+    assert view.search_active is False
+
+
+async def test_enter_ignores_a_selection_past_a_shrunk_list(view_pilot):
+    app, view, pilot = view_pilot
+    await _press(view, pilot, "j", "j")
+    await view.set_playlists([Playlist(id="p0", title="Only", item_count=0)])
+    app.messages.clear()
+    await _press(view, pilot, "enter")
+    assert not any(isinstance(m, PlaylistSelected) for m in app.messages)
@@ -183,3 +183,20 @@ async def test_confirm_modal_escape_cancels(app_pilot):
     await pilot.pause()
     assert not isinstance(app.screen, ConfirmationModal)
     assert results == [False]  # escape CANCELLED
+
+
+async def test_app_exit_closes_the_cache(monkeypatch, tmp_path):
+    """Shutdown checkpoints the WAL and releases the shared connection."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    async def _offline(self):
+        self.offline_mode = True
+        self.api_client = None
+
+    monkeypatch.setattr(YouTubeRangerApp, "setup_authentication", _offline)
+
+    app = YouTubeRangerApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        assert app._cache._conn is not None
+    assert app._cache._conn is None
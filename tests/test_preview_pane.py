@@ -0,0 +1,83 @@
+"""PreviewPane transcript rendering: metadata first, transcript decompressed off-loop."""
+
+import asyncio
+from types import SimpleNamespace
+
+from textual.app import App, ComposeResult
+from textual.widgets import Static
+
+from yanger.core.transcript_fetcher import TranscriptFetcher
+from yanger.models import Video
+from yanger.ui.miller_view import PreviewPane
+
+
+class _FakeCache:
+    def __init__(self, text):
+        self.row = {
+            "transcript_text": TranscriptFetcher.compress_transcript(text),
+            "fetch_status": "SUCCESS",
+            "language": "en",
+            "auto_generated": True,
+        }
+
+    def get_transcript(self, video_id):
+        return self.row
+
+
+def _settings():
+    return SimpleNamespace(transcripts=SimpleNamespace(enabled=True))
+
+
+class _PreviewApp(App):
+    def __init__(self, cache):
+        super().__init__()
+        self._cache = cache
+
+    def compose(self) -> ComposeResult:
+        yield PreviewPane(cache=self._cache, settings=_settings(), id="preview-pane")
+
+
+def _video():
+    return Video(id="v1", playlist_item_id="pi1", title="Title", channel_title="Chan")
+
+
+def _texts(pane):
+    return [str(w.render()) for w in pane.query(Static)]
+
+
+async def test_transcript_is_shown_truncated():
+    app = _PreviewApp(_FakeCache("x" * 1500))
+    async with app.run_test() as pilot:
+        pane = app.query_one(PreviewPane)
+        await pane.show_video(_video())
+        await pilot.pause()
+        texts = _texts(pane)
+        assert texts[0] == "Title"
+        assert "Transcript (en, auto-generated):" in texts[-2]
+        assert texts[-1] == "x" * 1000 + "..."
+
+
+async def test_superseded_preview_does_not_write_stale_transcript(monkeypatch):
+    app = _PreviewApp(_FakeCache("first transcript"))
+    async with app.run_test() as pilot:
+        pane = app.query_one(PreviewPane)
+
+        async def _replaced_while_decompressing(func, *args):
+            await pane.remove_children()  # what a newer show_video does first
+            return func(*args)
+
+        monkeypatch.setattr(asyncio, "to_thread", _replaced_while_decompressing)
+        await pane.show_video(_video())
+        await pilot.pause()
+        assert all("first transcript" not in t for t in _texts(pane))
+
+
+async def test_corrupt_transcript_leaves_no_placeholder():
+    cache = _FakeCache("")
+    cache.row["transcript_text"] = b"not a gzip stream"
+    app = _PreviewApp(cache)
+    async with app.run_test() as pilot:
+        pane = app.query_one(PreviewPane)
+        await pane.show_video(_video())
+        await pilot.pause()
+        assert _texts(pane) == ["Title", "Channel: Chan"]
@@ -0,0 +1,76 @@
+"""SearchHighlighter.highlight: Rich markup around case-insensitive literal matches."""
+
+import re
+
+import pytest
+
+from yanger.ui.search_input import SearchHighlighter
+
+
+@pytest.mark.parametrize("text,query,expected", [
+    ("Python Tips", "python", "[bold yellow]Python[/bold yellow] Tips"),
+    ("a.b a.b", "a.b", "[bold yellow]a.b[/bold yellow] [bold yellow]a.b[/bold yellow]"),
+    ("axb", "a.b", "axb"),  # query is a literal, not a regex
+    ("no match here", "zzz", "no match here"),
+    ("anything", "", "anything"),
+    ("needle", "needle", "[bold yellow]needle[/bold yellow]"),
+    ("abc", "abcd", "abc"),
+    ("Straße STRASSE", "straße", "[bold yellow]Straße[/bold yellow] STRASSE"),
+    ("ÉCOLE école", "École", "[bold yellow]ÉCOLE[/bold yellow] [bold yellow]école[/bold yellow]"),
+])
+def test_highlight(text, query, expected):
+    assert SearchHighlighter.highlight(text, query) == expected
+
+
+def test_custom_style():
+    assert SearchHighlighter.highlight("abc", "B", "red") == "a[red]b[/red]c"
+
+
+@pytest.mark.parametrize("text,query", [
+    ("aaaa", "aa"),
+    ("AbcABCabc", "abc"),
+    ("abc", "abcd"),
+    ("x" * 50 + "needle", "NEEDLE"),
+    ("needle at start", "needle"),
+    ("Ünïcode ÜNÏCODE", "ünï"),
+])
+def test_find_path_matches_regex_path(text, query):
+    """The lowered find loop and the regex fallback must produce identical markup."""
+    style = "bold yellow"
+    expected = re.sub(
+        re.escape(query),
+        lambda m: f"[{style}]{m.group(0)}[/{style}]",
+        text,
+        flags=re.IGNORECASE,
+    )
+    assert SearchHighlighter.highlight(text, query) == expected
+
+
+@pytest.mark.parametrize("text,query", [("plain ascii", "zzz"), ("ünïcode", "zzz")])
+def test_no_match_returns_the_original_object(text, query):
+    assert SearchHighlighter.highlight(text, query) is text
+
+
+def test_find_all_ci_spans():
+    assert SearchHighlighter._find_all_ci("AbcABCabc", "ABC") == [(0, 3), (3, 6), (6, 9)]
+    assert SearchHighlighter._find_all_ci("aaaa", "aa") == [(0, 2), (2, 4)]
+    assert SearchHighlighter._find_all_ci("Straße", "ss") == []  # lower(), not casefold()
+    assert SearchHighlighter._find_all_ci("İstanbul", "i") == [(0, 1)]  # lowering changes length
+
+
+@pytest.mark.parametrize("text,query", [
+    ("Straße", "ss"),
+    ("STRASSE", "straße"),
+    ("Straße", "STRASSE"),
+    ("Straße", "ẞ"),
+    ("ΟΔΥΣΣΕΥΣ", "σ"),
+    ("İstanbul", "i"),
+    ("İstanbul", "İ"),
+    ("ÉCOLE", "école"),
+])
+def test_matching_agrees_with_highlighting(text, query):
+    """A row counts as a search match exactly when the highlighter marks something in it."""
+    spans = SearchHighlighter._find_all_ci(text, query)
+    assert SearchHighlighter.matches(text, query) == bool(spans)
+    highlighted = SearchHighlighter.highlight(text, query)
+    assert (highlighted != text) == bool(spans)
@@ -0,0 +1,142 @@
+"""StatusBar: quota colouring, context/hint text and skipped no-op updates."""
+
+import pytest
+import pytest_asyncio
+
+from textual.app import App, ComposeResult
+
+from yanger.ui.status_bar import StatusBar
+
+
+class _BarApp(App):
+    def compose(self) -> ComposeResult:
+        yield StatusBar(id="status-bar")
+
+
+@pytest_asyncio.fixture
+async def bar_pilot():
+    app = _BarApp()
+    async with app.run_test() as pilot:
+        yield app.query_one(StatusBar), pilot
+
+
+def _text(widget):
+    return str(widget.render())
+
+
+async def test_quota_shows_remaining_and_colours_by_usage(bar_pilot):
+    bar, pilot = bar_pilot
+    bar.update_status("", "9000/10000")
+    assert _text(bar.right_widget) == "Quota left: 9,000"
+    assert not bar.right_widget.classes & {"quota-warning", "quota-critical"}
+
+    bar.update_status("", "2000/10000")
+    assert "quota-warning" in bar.right_widget.classes
+
+    bar.update_status("", "500/10000")
+    assert "quota-critical" in bar.right_widget.classes
+    assert "quota-warning" not in bar.right_widget.classes
+
+    bar.update_status("", "9999/10000")
+    assert not bar.right_widget.classes & {"quota-warning", "quota-critical"}
+
+
+@pytest.mark.parametrize("quota", ["n/a", "1/2/3", "²/10", "5/", "--5/10"])
+async def test_unparseable_quota_is_shown_verbatim(bar_pilot, quota):
+    bar, pilot = bar_pilot
+    bar.update_status("", quota)
+    assert _text(bar.right_widget) == f"Quota: {quota}"
+
+
+async def test_overspent_quota_is_critical(bar_pilot):
+    bar, pilot = bar_pilot
+    bar.update_status("", "-50/10000")
+    assert _text(bar.right_widget) == "Quota left: -50"
+    assert "quota-critical" in bar.right_widget.classes
+
+
+async def test_unchanged_quota_skips_the_right_widget(bar_pilot, monkeypatch):
+    bar, pilot = bar_pilot
+    bar.update_status("first", "100/10000")
+    updates = []
+    monkeypatch.setattr(bar.right_widget, "update", updates.append)
+    bar.update_status("second", "100/10000")
+    assert updates == []
+    assert _text(bar.center_widget) == "second"
+
+
+async def test_context_shows_mark_count_and_literal_brackets(bar_pilot):
+    bar, pilot = bar_pilot
+    bar.update_context("Mix (3 videos) [cached]")
+    assert _text(bar.left_widget) == "Mix (3 videos) [cached]"
+    bar.update_context("Mix (3 videos)", marked_count=2)
+    rendered = bar.left_widget.render()
+    assert str(rendered) == "Mrk 2 | Mix (3 videos)"
+    assert [(span.start, span.end) for span in rendered.spans] == [(0, 3)]  # yellow "Mrk"
+
+
+async def test_unchanged_context_skips_the_left_widget(bar_pilot, monkeypatch):
+    bar, pilot = bar_pilot
+    bar.update_context("Mix", marked_count=1)
+    updates = []
+    monkeypatch.setattr(bar.left_widget, "update", updates.append)
+    bar.update_context("Mix", marked_count=1)
+    assert updates == []
+    bar.update_context("Mix", marked_count=0)
+    assert len(updates) == 1
+
+
+async def test_hints_restore_after_status_and_skip_repeats(bar_pilot, monkeypatch):
+    bar, pilot = bar_pilot
+    assert _text(bar.center_widget) == StatusBar._DEFAULT_HINTS
+    bar.update_status("Press 'w' to rename")
+    bar.update_hints()
+    assert _text(bar.center_widget) == StatusBar._DEFAULT_HINTS
+    updates = []
+    monkeypatch.setattr(bar.center_widget, "update", updates.append)
+    bar.update_hints()
+    assert updates == []
+    bar.update_hints("custom")
+    assert updates == ["custom"]
+
+
+async def test_show_message_restores_hints_once(bar_pilot):
+    bar, pilot = bar_pilot
+    bar.show_message("first", duration=0.05)
+    bar.show_message("second", duration=0.05)
+    assert _text(bar.center_widget) == "second"
+    await pilot.pause(0.1)
+    assert _text(bar.center_widget) == StatusBar._DEFAULT_HINTS
+
+
+async def test_show_message_reset_keeps_newer_status(bar_pilot):
+    bar, pilot = bar_pilot
+    bar.show_message("saved", duration=0.05)
+    bar.update_status("Search: 1/3 matches")
+    await pilot.pause(0.1)
+    assert _text(bar.center_widget) == "Search: 1/3 matches"
+
+
+async def test_repeated_status_bar_updates_touch_no_widget(bar_pilot, monkeypatch):
+    bar, pilot = bar_pilot
+    bar.update_context("Mix", marked_count=1)
+    bar.update_status("Search: 1/2 matches", "9000/10000")
+    updates = []
+    for widget in (bar.left_widget, bar.center_widget, bar.right_widget):
+        monkeypatch.setattr(widget, "update", updates.append)
+    for _ in range(3):
+        bar.update_context("Mix", marked_count=1)
+        bar.update_status("Search: 1/2 matches", "9000/10000")
+    assert updates == []
+
+
+async def test_quota_bucket_edges(bar_pilot):
+    bar, pilot = bar_pilot
+    for quota, expected in [
+        ("2500/10000", {"quota-warning"}),   # exactly 75% used
+        ("2501/10000", set()),
+        ("1000/10000", {"quota-critical"}),  # exactly 90% used
+        ("0/0", set()),                      # no total: never coloured
+    ]:
+        bar.update_status("", quota)
+        assert bar.right_widget.classes & {"quota-warning", "quota-critical"} == expected, quota
@@ -9,15 +9,17 @@ Tests TranscriptFetcher class functionality including:
 # Created: 2025-11-07
 
 import pytest
+import dataclasses
 import gzip
 import json
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import patch
 
 from yanger.core.transcript_fetcher import (
     TranscriptFetcher,
     TranscriptData,
     TranscriptSegment
 )
+from fakes import FakeTranscript, FakeTranscriptAPI, FakeTranscriptList
 
 
 class TestTranscriptFetcher:
@@ -59,6 +61,12 @@ class TestTranscriptFetcher:
         decompressed = TranscriptFetcher.decompress_transcript(compressed)
         assert decompressed == original_text
 
+    def test_compressed_blobs_stay_gzip_compatible(self):
+        """Blobs must stay plain gzip: older caches and GzipFile-based export read them."""
+        text = "Hello 世界 " * 20
+        assert gzip.decompress(TranscriptFetcher.compress_transcript(text)).decode('utf-8') == text
+        assert TranscriptFetcher.decompress_transcript(gzip.compress(text.encode('utf-8'))) == text
+
     def test_compress_unicode_text(self):
         """Test compression handles Unicode characters."""
         unicode_text = "Hello 世界 🌍 Здравствуй"
@@ -74,6 +82,26 @@ class TestTranscriptFetcher:
 
         assert decompressed == ""
 
+    @pytest.mark.parametrize("max_chars", [None, 1000])
+    def test_decompress_empty_blob(self, max_chars):
+        """A missing (empty) blob decompresses to empty text rather than raising."""
+        assert TranscriptFetcher.decompress_transcript(b"", max_chars) == ""
+
+    @pytest.mark.parametrize("text", [
+        "short",
+        "a" * 1000,
+        "a" * 1001,
+        "ü🌍 " * 2000,
+    ])
+    def test_decompress_prefix_matches_full_truncation(self, text):
+        """Partial decompression yields a prefix that truncates like the full text."""
+        compressed = TranscriptFetcher.compress_transcript(text)
+        head = TranscriptFetcher.decompress_transcript(compressed, max_chars=1000)
+
+        assert text.startswith(head)
+        assert (len(head) > 1000) == (len(text) > 1000)
+        assert head[:1000] == text[:1000]
+
     def test_format_as_text(self, sample_transcript_data):
         """Test formatting transcript as plain text."""
         text = TranscriptFetcher.format_as_text(sample_transcript_data)
@@ -97,6 +125,70 @@ class TestTranscriptFetcher:
         assert data['segments'][0]['text'] == "Hello world"
         assert data['segments'][0]['start'] == 0.0
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_format_as_json_backends_agree(self, monkeypatch, use_orjson):
+        """orjson (when installed) and the stdlib fallback write the same bytes."""
+        from yanger.core import transcript_fetcher
+
+        if use_orjson and transcript_fetcher.orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(transcript_fetcher, "orjson", None)
+        transcript = TranscriptData(
+            video_id="v", language="ja", auto_generated=True,
+            segments=(
+                TranscriptSegment(start=0.5, duration=1.25, text="こんにちは \"world\""),
+                TranscriptSegment(start=1754.08, duration=3.0, text="🌍\ttab"),
+            ),
+            fetched_at="2024-01-15T12:00:00Z",
+        )
+
+        json_str = TranscriptFetcher.format_as_json(transcript)
+
+        assert json_str == (
+            '{\n'
+            '  "video_id": "v",\n'
+            '  "language": "ja",\n'
+            '  "auto_generated": true,\n'
+            '  "fetched_at": "2024-01-15T12:00:00Z",\n'
+            '  "segments": [\n'
+            '    {\n'
+            '      "start": 0.5,\n'
+            '      "duration": 1.25,\n'
+            '      "text": "こんにちは \\"world\\""\n'
+            '    },\n'
+            '    {\n'
+            '      "start": 1754.08,\n'
+            '      "duration": 3.0,\n'
+            '      "text": "🌍\\ttab"\n'
+            '    }\n'
+            '  ]\n'
+            '}'
+        )
+        assert json.loads(json_str) == transcript.to_dict()
+        assert TranscriptFetcher.parse_json(json_str) == transcript.to_dict()
+        assert TranscriptFetcher.parse_json(json_str.encode('utf-8')) == transcript.to_dict()
+
+    @pytest.mark.parametrize("segments", [
+        (),
+        (TranscriptSegment(0, 1, ""),),
+        (TranscriptSegment(0.5, 1.25, "line\nbreak \"quoted\" \\ tab\t"),
+         TranscriptSegment(1.75, 1e-05, "こんにちは 🌍")),
+    ])
+    def test_stdlib_format_as_json_matches_json_dumps(self, monkeypatch, segments):
+        """The templated fallback writes byte-for-byte what json.dumps writes."""
+        from yanger.core import transcript_fetcher
+
+        monkeypatch.setattr(transcript_fetcher, "orjson", None)
+        transcript = TranscriptData(
+            video_id="v\"id", language="en", auto_generated=False,
+            segments=segments, fetched_at="2024-01-15T12:00:00Z",
+        )
+
+        json_str = TranscriptFetcher.format_as_json(transcript)
+
+        assert json_str == json.dumps(transcript.to_dict(), indent=2, ensure_ascii=False)
+
     def test_format_for_display_short_transcript(self, sample_transcript_data):
         """Test display formatting with short transcript."""
         display_text = TranscriptFetcher.format_for_display(sample_transcript_data, max_chars=1000)
@@ -112,13 +204,23 @@ class TestTranscriptFetcher:
         assert "Transcript (en, manual):" in display_text
         assert "..." in display_text  # Should be truncated
 
+    @pytest.mark.parametrize("max_chars", [0, 5, 11, 12, 13, 20, 1000])
+    def test_format_for_display_matches_full_text_truncation(self, sample_transcript_data, max_chars):
+        """Joining only the leading segments truncates exactly like the full text."""
+        text = TranscriptFetcher.format_as_text(sample_transcript_data)
+        expected = text[:max_chars] + "..." if len(text) > max_chars else text
+
+        display_text = TranscriptFetcher.format_for_display(sample_transcript_data, max_chars=max_chars)
+
+        assert display_text == "Transcript (en, manual):\n" + expected
+
     def test_format_for_display_auto_generated(self):
         """Test display format shows auto-generated label."""
         transcript = TranscriptData(
             video_id="test",
             language="es",
             auto_generated=True,
-            segments=[TranscriptSegment(0.0, 1.0, "Hola")],
+            segments=(TranscriptSegment(0.0, 1.0, "Hola"),),
             fetched_at="2024-01-15T12:00:00Z"
         )
 
@@ -130,15 +232,15 @@ class TestTranscriptFetcher:
 class TestTranscriptFetcherWithMockAPI:
     """Test TranscriptFetcher with mocked YouTube API."""
 
-    def setup_mock_fetcher(self, mock_api, mock_errors=None):
-        """Helper to create fetcher with mocked API.
+    def setup_mock_fetcher(self, api, mock_errors=None):
+        """Helper to create fetcher with a fake API.
 
         `api` is a read-only property backed by `_api_instance`, so inject the
-        mock there (and mark the library available) rather than assigning `api`.
+        fake there (and mark the library available) rather than assigning `api`.
         """
         fetcher = TranscriptFetcher.__new__(TranscriptFetcher)
         fetcher._api_available = True
-        fetcher._api_instance = mock_api
+        fetcher._api_instance = api
         fetcher.errors = mock_errors or {}
         fetcher.preferred_languages = ['en']
         return fetcher
@@ -154,7 +256,7 @@ class TestTranscriptFetcherWithMockAPI:
         assert result.video_id == "test_video_id"
         assert result.language == "en"
         assert result.auto_generated is False
-        assert len(result.segments) == 2
+        assert isinstance(result.segments, tuple) and len(result.segments) == 2
         assert result.segments[0].text == "Hello world"
 
     def test_fetch_transcript_with_preferred_language(self):
@@ -164,14 +266,8 @@ class TestTranscriptFetcherWithMockAPI:
             FetchedTranscriptSnippet,
         )
 
-        mock_api = MagicMock()
-        mock_transcript_list = MagicMock()
-
-        # Mock Spanish transcript (1.x fetch() returns a FetchedTranscript)
-        mock_es_transcript = MagicMock()
-        mock_es_transcript.language_code = "es"
-        mock_es_transcript.is_generated = False
-        mock_es_transcript.fetch.return_value = FetchedTranscript(
+        # Spanish transcript (1.x fetch() returns a FetchedTranscript)
+        es_transcript = FakeTranscript("es", FetchedTranscript(
             snippets=[
                 FetchedTranscriptSnippet(text="Hola mundo", start=0.0, duration=1.0)
             ],
@@ -179,12 +275,10 @@ class TestTranscriptFetcherWithMockAPI:
             language="Spanish",
             language_code="es",
             is_generated=False,
-        )
+        ))
+        api = FakeTranscriptAPI(FakeTranscriptList([es_transcript]))
 
-        mock_transcript_list.find_transcript.return_value = mock_es_transcript
-        mock_api.list.return_value = mock_transcript_list
-
-        fetcher = self.setup_mock_fetcher(mock_api)
+        fetcher = self.setup_mock_fetcher(api)
         fetcher.preferred_languages = ['es', 'en']
 
         result, status = fetcher.fetch_transcript("test_video")
@@ -193,36 +287,16 @@ class TestTranscriptFetcherWithMockAPI:
         assert result.language == "es"
         assert result.segments[0].text == "Hola mundo"
 
-    def test_fetch_transcript_no_transcript_found(self, mock_transcript_errors):
-        """Test handling when no transcript is found."""
-        mock_api = MagicMock()
-        mock_api.list.side_effect = mock_transcript_errors['NoTranscriptFound']()
-
-        fetcher = self.setup_mock_fetcher(mock_api, mock_transcript_errors)
-
-        result, status = fetcher.fetch_transcript("no_transcript_video")
+    @pytest.mark.parametrize("error_name", [
+        "NoTranscriptFound",
+        "TranscriptsDisabled",
+        "VideoUnavailable",
+    ])
+    def test_fetch_transcript_not_available(self, mock_transcript_errors, error_name):
+        """Missing, disabled and unavailable transcripts all map to NOT_AVAILABLE."""
+        api = FakeTranscriptAPI(error=mock_transcript_errors[error_name]())
 
-        assert result is None
-        assert status == 'NOT_AVAILABLE'
-
-    def test_fetch_transcript_disabled(self, mock_transcript_errors):
-        """Test handling when transcripts are disabled."""
-        mock_api = MagicMock()
-        mock_api.list.side_effect = mock_transcript_errors['TranscriptsDisabled']()
-
-        fetcher = self.setup_mock_fetcher(mock_api, mock_transcript_errors)
-
-        result, status = fetcher.fetch_transcript("disabled_video")
-
-        assert result is None
-        assert status == 'NOT_AVAILABLE'
-
-    def test_fetch_transcript_video_unavailable(self, mock_transcript_errors):
-        """Test handling when video is unavailable."""
-        mock_api = MagicMock()
-        mock_api.list.side_effect = mock_transcript_errors['VideoUnavailable']()
-
-        fetcher = self.setup_mock_fetcher(mock_api, mock_transcript_errors)
+        fetcher = self.setup_mock_fetcher(api, mock_transcript_errors)
 
         result, status = fetcher.fetch_transcript("unavailable_video")
 
@@ -231,10 +305,9 @@ class TestTranscriptFetcherWithMockAPI:
 
     def test_fetch_transcript_generic_error(self):
         """Test handling of unexpected errors."""
-        mock_api = MagicMock()
-        mock_api.list.side_effect = Exception("Network error")
+        api = FakeTranscriptAPI(error=Exception("Network error"))
 
-        fetcher = self.setup_mock_fetcher(mock_api)
+        fetcher = self.setup_mock_fetcher(api)
 
         result, status = fetcher.fetch_transcript("error_video")
 
@@ -267,13 +340,22 @@ class TestTranscriptData:
             video_id="empty",
             language="en",
             auto_generated=False,
-            segments=[],
+            segments=(),
             fetched_at="2024-01-15T12:00:00Z"
         )
 
         data_dict = transcript.to_dict()
         assert data_dict['segments'] == []
 
+    def test_to_dict_is_built_once(self, sample_transcript_data):
+        """Repeated serialization reuses the dictionary built on first use."""
+        assert sample_transcript_data.to_dict() is sample_transcript_data.to_dict()
+
+    def test_transcript_data_is_frozen(self, sample_transcript_data):
+        """Fields cannot be reassigned under the cached dictionary."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sample_transcript_data.language = "fr"
+
 
 class TestTranscriptSegment:
     """Test TranscriptSegment dataclass."""
@@ -297,3 +379,11 @@ class TestTranscriptSegment:
 
         assert len(segment.text) == 10000
         assert segment.text == long_text
+
+    def test_segment_has_no_instance_dict(self):
+        """Segments are slotted and immutable."""
+        segment = TranscriptSegment(0.0, 1.0, "Slotted")
+
+        assert not hasattr(segment, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            segment.text = "changed"
@@ -4,14 +4,17 @@ Tests TranscriptSettings dataclass and integration with Settings system.
 """
 # Created: 2025-11-07
 
+import io
 import pytest
 import yaml
-from pathlib import Path
 
 from yanger.config.settings import (
     Settings,
     TranscriptSettings,
-    load_settings
+    load_settings,
+    DEFAULT_CONFIG_PATH,
+    _SafeLoader,
+    _load_settings_from_streams,
 )
 
 
@@ -124,6 +127,16 @@ class TestSettingsIntegration:
         assert settings1.transcripts.enabled is True  # Overwritten by settings2's default
 
 
+def _settings_with_user_config(user_config):
+    """Load settings as load_settings does, with the user config held in memory.
+
+    The on-disk round trip (and load_settings' .env/env-var handling) is covered by
+    test_load_custom_user_config; the edge cases only need the parse and merge.
+    """
+    with open(DEFAULT_CONFIG_PATH) as f:
+        return _load_settings_from_streams(f, io.StringIO(yaml.dump(user_config)))
+
+
 class TestConfigFileLoading:
     """Test loading transcript settings from YAML config files."""
 
@@ -131,10 +144,8 @@ class TestConfigFileLoading:
         """Test loading transcript settings from default config."""
         # This tests against the actual default_config.yaml
         # Note: Requires the actual file to exist
-        default_config = Path(__file__).parent.parent / "config" / "default_config.yaml"
-
-        if default_config.exists():
-            with open(default_config) as f:
+        if DEFAULT_CONFIG_PATH.exists():
+            with open(DEFAULT_CONFIG_PATH) as f:
                 config = yaml.safe_load(f)
 
             assert 'transcripts' in config
@@ -173,44 +184,40 @@ class TestConfigFileLoading:
         assert settings.transcripts.export_directory == str(tmp_path / "my_transcripts")
         assert settings.transcripts.languages == ['es', 'en', 'fr']
 
-    def test_config_with_null_export_directory(self, tmp_path):
+    def test_config_with_null_export_directory(self):
         """Test config with null export_directory falls back to default."""
-        config_dir = tmp_path / "config"
-        config_dir.mkdir()
-        config_file = config_dir / "config.yaml"
-
-        custom_config = {
+        settings = _settings_with_user_config({
             'transcripts': {
                 'export_directory': None
             }
-        }
+        })
 
-        with open(config_file, 'w') as f:
-            yaml.dump(custom_config, f)
-
-        settings = load_settings(config_dir)
         # When null is explicitly set, it falls back to default from default_config.yaml
         assert settings.transcripts.export_directory == '~/.cache/yanger/transcripts'
 
-    def test_config_with_empty_languages(self, tmp_path):
+    def test_config_with_empty_languages(self):
         """Test config with empty languages list."""
-        config_dir = tmp_path / "config"
-        config_dir.mkdir()
-        config_file = config_dir / "config.yaml"
-
-        custom_config = {
+        settings = _settings_with_user_config({
             'transcripts': {
                 'languages': []
             }
-        }
-
-        with open(config_file, 'w') as f:
-            yaml.dump(custom_config, f)
+        })
 
-        settings = load_settings(config_dir)
         # Should accept empty list
         assert settings.transcripts.languages == []
 
+    def test_empty_user_config_keeps_defaults(self):
+        """An empty user config document is skipped rather than merged."""
+        settings = _settings_with_user_config(None)
+
+        assert settings.transcripts.export_directory == '~/.cache/yanger/transcripts'
+
+    def test_config_loader_stays_safe(self):
+        """The (C when available) loader keeps safe_load's schema: no Python tags."""
+        assert yaml.load("a: [1, 2]", Loader=_SafeLoader) == {'a': [1, 2]}
+        with pytest.raises(yaml.constructor.ConstructorError):
+            yaml.load("!!python/object/apply:os.getcwd []", Loader=_SafeLoader)
+
 
 class TestSettingsValidation:
     """Test settings validation and edge cases."""
@@ -0,0 +1,201 @@
+"""VideoColumn selection state: the mark bitmap and its round-trip onto Video objects.
+
+Mounts a bare VideoColumn in a minimal headless app so the async refresh tasks the column
+schedules have a running loop to land on.
+"""
+
+import pytest
+import pytest_asyncio
+
+from textual.app import App, ComposeResult
+
+from yanger.models import Video
+from yanger.ui.miller_view import VideoColumn
+
+
+def _videos(n):
+    return [
+        Video(id=f"v{i}", playlist_item_id=f"pi{i}", title=f"Video {i}", channel_title="C")
+        for i in range(n)
+    ]
+
+
+class _ColumnApp(App):
+    def compose(self) -> ComposeResult:
+        yield VideoColumn(id="video-column")
+
+
+@pytest_asyncio.fixture
+async def column_pilot():
+    app = _ColumnApp()
+    async with app.run_test() as pilot:
+        col = app.query_one(VideoColumn)
+        await col.set_videos(_videos(6))
+        await pilot.pause()
+        yield col, pilot
+        await pilot.pause()
+
+
+@pytest.fixture
+def column(column_pilot):
+    return column_pilot[0]
+
+
+async def test_toggle_and_count(column):
+    column.selected_index = 2
+    column.toggle_mark()
+    assert column.get_marked_count() == 1
+    assert [v.id for v in column.get_marked_videos()] == ["v2"]
+    column.toggle_mark()
+    assert column.get_marked_videos() == []
+
+
+async def test_select_all_invert_and_clear(column):
+    column.select_all()
+    assert column.get_marked_count() == 6
+    column.selected_index = 0
+    column.toggle_mark()
+    column.invert_selection()
+    assert [v.id for v in column.get_marked_videos()] == ["v0"]
+    column.clear_marks()
+    assert column.get_marked_count() == 0
+
+
+async def test_visual_range_marks_and_unmarks(column):
+    column.selected_index = 1
+    column.enter_visual_mode()
+    column.selected_index = 3
+    column.exit_visual_mode(mark_selection=True)
+    assert [v.id for v in column.get_marked_videos()] == ["v1", "v2", "v3"]
+
+    column.selected_index = 2
+    column.enter_visual_mode(unmark_mode=True)
+    column.selected_index = 5
+    column.exit_visual_mode(mark_selection=True)
+    assert [v.id for v in column.get_marked_videos()] == ["v1"]
+
+
+async def test_marks_survive_reordering_the_same_videos(column):
+    """Sorting hands set_videos the same Video objects in a new order; marks must follow."""
+    column.selected_index = 4
+    column.toggle_mark()
+    reordered = list(reversed(column.videos))
+    await column.set_videos(reordered)
+    assert [v.id for v in column.get_marked_videos()] == ["v4"]
+    assert column.videos[1].is_marked is True
+
+
+async def test_search_builds_match_mask(column):
+    column.videos[1].title = "Python tips"
+    column.videos[4].title = "More python"
+    assert column.search("PYTHON") == 2
+    assert column.search_matches == [1, 4]
+    assert list(column._match_mask) == [0, 1, 0, 0, 1, 0]
+    column.clear_search()
+    assert column.search_matches == []
+    assert not any(column._match_mask)
+
+
+async def test_search_matches_the_rows_it_highlights(column):
+    column.videos[0].title = "Straße"
+    column.videos[2].title = "STRASSE"
+    column.videos[3].title = "İstanbul"
+    assert column.search("straße") == 1  # lower() keeps ß distinct from "ss"
+    assert column.search_matches == [0]
+    assert column.search("istan") == 1
+    assert column.search_matches == [3]
+
+
+def _line(column, index):
+    return column._rows.render_line(index - column._rows.start)
+
+
+def _bg(column, index):
+    style = next(iter(_line(column, index))).style
+    return style.bgcolor if style else None
+
+
+async def test_selection_moves_highlight_on_rendered_lines(column):
+    selected_bg = _bg(column, 0)
+    plain_bg = _bg(column, 1)
+    assert selected_bg != plain_bg
+    column.move_selection(2)
+    assert _bg(column, 0) == plain_bg
+    assert _bg(column, 2) == selected_bg
+
+
+async def test_rendered_rows_reflect_state(column_pilot):
+    column, pilot = column_pilot
+    column.videos[3].title = "needle"
+    column.search("needle")
+    column.toggle_mark()  # selection jumped to the match at index 3
+    await pilot.pause()
+    assert column.render_row(3)[1] == (True, True, True)
+    assert column.render_row(0)[1] == (False, False, False)
+    line = _line(column, 3)
+    assert line.text.startswith(" ◆ needle")
+    assert line.cell_length == column._rows.size.width
+    assert any(seg.style.bold for seg in line)
+    assert _line(column, 0).text.startswith("   Video 0")
+
+
+async def test_next_prev_match_are_relative_to_the_cursor(column):
+    for i in (1, 4):
+        column.videos[i].title = "needle"
+    column.search("needle")
+    assert column.selected_index == 1
+    column.selected_index = 2  # user moved off the match between searches
+    assert column.next_match() and column.selected_index == 4
+    assert column.current_match_index == 1
+    assert column.next_match() and column.selected_index == 1  # wraps
+    column.selected_index = 3
+    assert column.prev_match() and column.selected_index == 1
+    assert column.prev_match() and column.selected_index == 4  # wraps
+
+
+async def test_visual_mode_enter_and_cancel_repaint_without_rebuilding(column, monkeypatch):
+    rows = column._rows
+    rebuilds = []
+    monkeypatch.setattr(column, "refresh_display", lambda: rebuilds.append(1))
+    column.selected_index = 2
+    column.enter_visual_mode()
+    assert column.render_row(2)[0].startswith("◆ ")
+    column.selected_index = 3
+    column.exit_visual_mode(mark_selection=False)
+    assert column.render_row(2)[0].startswith("  ")
+    assert column.get_marked_count() == 0
+    assert rebuilds == [] and column._rows is rows
+
+
+async def test_marking_repaints_without_rebuilding(column, monkeypatch):
+    rows = column._rows
+    rebuilds = []
+    monkeypatch.setattr(column, "refresh_display", lambda: rebuilds.append(1))
+    column.selected_index = 2
+    column.toggle_mark()
+    assert column.render_row(2)[0].startswith("◆ ")
+    column.invert_selection()
+    assert column.render_row(2)[0].startswith("  ")
+    assert column.render_row(0)[0].startswith("◆ ")
+    column.select_all()
+    assert column.get_marked_count() == len(column.videos)
+    column.unselect_all()
+    column.toggle_mark()
+    column.clear_marks()
+    assert column.get_marked_count() == 0
+    assert rebuilds == [] and column._rows is rows
+
+
+async def test_scheduled_refreshes_coalesce(column_pilot, monkeypatch):
+    column, pilot = column_pilot
+    runs = []
+
+    async def _refresh():
+        runs.append(1)
+
+    monkeypatch.setattr(column, "refresh_display", _refresh)
+    for _ in range(3):
+        column._schedule_refresh()
+    await pilot.pause()
+    await column.app.workers.wait_for_complete()
+    assert runs == [1]